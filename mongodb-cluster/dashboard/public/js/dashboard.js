@@ -8,7 +8,58 @@ let socket;
 let authToken = localStorage.getItem('authToken');
 let config = {};
 let charts = {};
-let updateInterval;
+let socketConnectedBefore = false;
+
+// Cluster state rebuilt from numbered cluster_update frames; all but full
+// frames carry only the node fields that changed
+let clusterState = null;
+let lastFrameSeq = 0;
+let resyncPending = false;
+let configSaveInFlight = false;
+
+// Number of samples kept in the time-series charts
+const CHART_HISTORY_LENGTH = 20;
+
+// Notifications on screen, keyed by type and message so repeats refresh the
+// existing alert instead of stacking duplicates
+const NOTIFICATION_TIMEOUT_MS = 5000;
+
+// Command results kept in the SSH output log, and the most text one result
+// shows (the tail is kept, since that is where errors and prompts end up)
+const SSH_OUTPUT_MAX_ENTRIES = 200;
+const SSH_OUTPUT_MAX_CHARS = 64 * 1024;
+const activeNotifications = new Map();
+
+// In-flight requests by purpose; starting a newer request of the same kind
+// aborts the older one so stale responses never overwrite fresher data
+const pendingRequests = new Map();
+
+// Elements touched on every update or form submission, looked up once; the
+// script loads at the end of <body> so they all exist by now
+const elements = {
+    connectionStatus: document.getElementById('connectionStatus'),
+    replicaSetStatus: document.getElementById('replicaSetStatus'),
+    activeNodes: document.getElementById('activeNodes'),
+    totalDocuments: document.getElementById('totalDocuments'),
+    clusterTopology: document.getElementById('clusterTopology'),
+    nodesContainer: document.getElementById('nodesContainer'),
+    replicationLag: document.getElementById('replicationLag'),
+    queryNode: document.getElementById('queryNode'),
+    queryCollection: document.getElementById('queryCollection'),
+    queryOperation: document.getElementById('queryOperation'),
+    queryText: document.getElementById('queryText'),
+    queryProjection: document.getElementById('queryProjection'),
+    queryResults: document.getElementById('queryResults'),
+    queryStats: document.getElementById('queryStats'),
+    sshNode: document.getElementById('sshNode'),
+    sshCommand: document.getElementById('sshCommand'),
+    sshOutput: document.getElementById('sshOutput'),
+    rawConfig: document.getElementById('rawConfig'),
+    nodesConfig: document.getElementById('nodesConfig'),
+    replicaSetName: document.getElementById('replicaSetName'),
+    configTab: document.getElementById('config-tab')
+};
+const nodeCardTemplate = document.getElementById('nodeCardTemplate');
 
 // Initialize dashboard
 document.addEventListener('DOMContentLoaded', function() {
@@ -86,20 +137,12 @@ async function initializeDashboard() {
         // Setup Socket.IO connection
         setupSocketConnection();
         
-        // Load initial data
-        await loadConfiguration();
-        await updateClusterStatus();
-        await updateDatabaseStats();
+        // Load initial data in a single round trip
+        await loadBootstrap();
         
         // Setup charts
         initializeCharts();
         
-        // Setup periodic updates
-        startPeriodicUpdates();
-        
-        // Populate dropdowns
-        populateDropdowns();
-        
         showNotification('Dashboard initialized successfully', 'success');
     } catch (error) {
         console.error('Dashboard initialization error:', error);
@@ -109,28 +152,72 @@ async function initializeDashboard() {
 
 // Socket.IO setup
 function setupSocketConnection() {
-    socket = io();
+    // Open the websocket directly instead of starting on HTTP long-polling and
+    // upgrading; polling remains as a fallback when websockets are blocked
+    socket = io({ transports: ['websocket', 'polling'] });
     
     socket.on('connect', function() {
         console.log('Connected to server');
-        document.getElementById('connectionStatus').innerHTML = 
-            '<i class="bi bi-circle-fill text-success"></i> Connected';
-        socket.emit('subscribe_monitoring');
+        setConnectionStatus(true);
+        resyncPending = false;
+        // Background tabs stay unsubscribed until they become visible again
+        if (!document.hidden) {
+            socket.emit('subscribe_monitoring');
+        }
+        
+        // Updates are pushed over the socket; after a reconnect, hydrate once over
+        // REST to cover whatever was missed while disconnected
+        if (socketConnectedBefore) {
+            updateClusterStatus();
+            updateDatabaseStats();
+        }
+        socketConnectedBefore = true;
     });
     
     socket.on('disconnect', function() {
         console.log('Disconnected from server');
-        document.getElementById('connectionStatus').innerHTML = 
-            '<i class="bi bi-circle-fill text-danger"></i> Disconnected';
+        setConnectionStatus(false);
     });
     
     socket.on('cluster_update', function(data) {
-        updateDashboardData(data);
+        // Frames already in flight when the tab was hidden are dropped; the
+        // full frame sent on resubscribe replaces whatever they carried
+        if (document.hidden) {
+            return;
+        }
+        applyClusterFrame(data);
+    });
+    
+    // Another dashboard saved the configuration; the event carries no config
+    // (sockets are unauthenticated), so fetch it over the authenticated API
+    socket.on('config_changed', function() {
+        // Unsaved edits in the config tab are kept; the user reloads when ready
+        if (configEditorDirty) {
+            showNotification('Configuration changed on another dashboard. Click Reload to load it and discard your edits', 'warning');
+            return;
+        }
+        loadConfiguration();
     });
 }
 
-// API helper function
-async function apiRequest(url, options = {}) {
+// Stop receiving monitoring frames while the tab is hidden; subscribing again on
+// return delivers the full current state. Registered once for the page and
+// applied to whichever socket the current login opened
+document.addEventListener('visibilitychange', function() {
+    if (!socket || !socket.connected) {
+        return;
+    }
+    socket.emit(document.hidden ? 'unsubscribe_monitoring' : 'subscribe_monitoring');
+});
+
+// Show the socket state in the navbar
+function setConnectionStatus(connected) {
+    const icon = createTextElement('i', `bi bi-circle-fill ${connected ? 'text-success' : 'text-danger'}`);
+    elements.connectionStatus.replaceChildren(icon, connected ? ' Connected' : ' Disconnected');
+}
+
+// API helper functions
+async function apiFetch(url, options = {}) {
     const defaultOptions = {
         headers: {
             'Authorization': `Bearer ${authToken}`,
@@ -145,41 +232,152 @@ async function apiRequest(url, options = {}) {
         throw new Error('Unauthorized');
     }
     
+    return response;
+}
+
+async function apiRequest(url, options = {}) {
+    const response = await apiFetch(url, options);
     return response.json();
 }
 
+// Abort the previous request registered under key and return a signal for the next one
+function replacePendingRequest(key) {
+    const previous = pendingRequests.get(key);
+    if (previous) {
+        previous.abort();
+    }
+    const controller = new AbortController();
+    pendingRequests.set(key, controller);
+    return controller.signal;
+}
+
+function isAbortError(error) {
+    return error.name === 'AbortError';
+}
+
+// Read an NDJSON response body, handing each parsed line to onLine as it arrives
+async function readNdjson(response, onLine) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+        
+        let newline;
+        while ((newline = buffer.indexOf('\n')) !== -1) {
+            const line = buffer.slice(0, newline);
+            buffer = buffer.slice(newline + 1);
+            if (line.trim()) {
+                onLine(JSON.parse(line));
+            }
+        }
+        
+        if (done) {
+            break;
+        }
+    }
+    
+    if (buffer.trim()) {
+        onLine(JSON.parse(buffer));
+    }
+}
+
+// Load configuration, cluster status and database stats in one request
+async function loadBootstrap() {
+    try {
+        const bootstrap = await apiRequest('/api/bootstrap');
+        applyConfiguration(bootstrap.config);
+        
+        if (bootstrap.status) {
+            applyClusterStatus(bootstrap.status);
+        } else {
+            console.error('Failed to load cluster status:', bootstrap.errors.status);
+        }
+        if (bootstrap.databaseStats) {
+            updateDatabaseStatsDisplay(bootstrap.databaseStats);
+        } else {
+            console.error('Failed to load database stats:', bootstrap.errors.databaseStats);
+        }
+    } catch (error) {
+        console.error('Failed to load dashboard data:', error);
+        showNotification('Failed to load dashboard data', 'danger');
+    }
+}
+
 // Load configuration
 async function loadConfiguration() {
     try {
-        config = await apiRequest('/api/config');
-        document.getElementById('replicaSetName').value = config.mongodb_cluster.replica_set_name;
-        updateRawConfig();
-        updateNodesConfig();
+        const signal = replacePendingRequest('config');
+        applyConfiguration(await apiRequest('/api/config', { signal }));
     } catch (error) {
+        if (isAbortError(error)) {
+            return;
+        }
         console.error('Failed to load configuration:', error);
         showNotification('Failed to load configuration', 'danger');
     }
 }
 
+// The config tab's editor and node forms are only built when that tab is shown;
+// until then a new configuration just marks them stale
+let configFormStale = true;
+// Set once the user edits the config tab, cleared when it is re-rendered
+let configEditorDirty = false;
+
+// Single entry point for a new configuration: node dropdowns are refreshed now,
+// the config tab's forms when they are next visible
+function applyConfiguration(newConfig) {
+    config = newConfig;
+    populateDropdowns();
+    configFormStale = true;
+    if (elements.configTab.classList.contains('active')) {
+        renderConfigForm();
+    }
+}
+
+function renderConfigForm() {
+    if (!configFormStale || !config) {
+        return;
+    }
+    configFormStale = false;
+    configEditorDirty = false;
+    elements.replicaSetName.value = config.mongodb_cluster.replica_set_name;
+    updateRawConfig();
+    updateNodesConfig();
+}
+
 // Update cluster status
 async function updateClusterStatus() {
     try {
-        const status = await apiRequest('/api/cluster/status');
-        updateStatusCards(status);
-        updateClusterTopology(status);
-        updateReplicationTable(status);
-        updateNodesTab(status);
+        const signal = replacePendingRequest('clusterStatus');
+        applyClusterStatus(await apiRequest('/api/cluster/status', { signal }));
     } catch (error) {
+        if (isAbortError(error)) {
+            return;
+        }
         console.error('Failed to update cluster status:', error);
     }
 }
 
+function applyClusterStatus(status) {
+    updateStatusCards(status);
+    updateClusterTopology(status);
+    updateReplicationTable(status);
+    updateNodesTab(status);
+}
+
 // Update database statistics
 async function updateDatabaseStats() {
     try {
-        const stats = await apiRequest('/api/database/stats');
+        const signal = replacePendingRequest('databaseStats');
+        const stats = await apiRequest('/api/database/stats', { signal });
         updateDatabaseStatsDisplay(stats);
     } catch (error) {
+        if (isAbortError(error)) {
+            return;
+        }
         console.error('Failed to update database stats:', error);
     }
 }
@@ -187,121 +385,167 @@ async function updateDatabaseStats() {
 // Update status cards
 function updateStatusCards(status) {
     const activeNodes = status.nodes.filter(node => node.status === 'online').length;
-    const totalDocuments = status.nodes.reduce((sum, node) => {
-        return sum + (node.dbStats ? node.dbStats.count : 0);
-    }, 0);
     
-    document.getElementById('replicaSetStatus').textContent = status.replicaSet.set;
-    document.getElementById('activeNodes').textContent = `${activeNodes}/${status.nodes.length}`;
-    document.getElementById('totalDocuments').textContent = formatNumber(totalDocuments);
+    elements.replicaSetStatus.textContent = status.replicaSet.set;
+    elements.activeNodes.textContent = `${activeNodes}/${status.nodes.length}`;
 }
 
-// Update cluster topology visualization
-function updateClusterTopology(status) {
-    const container = document.getElementById('clusterTopology');
-    container.innerHTML = '';
+// Update database statistics display
+function updateDatabaseStatsDisplay(stats) {
+    const totalDocuments = Object.values(stats.collections || {}).reduce((sum, count) => sum + count, 0);
+    elements.totalDocuments.textContent = formatNumber(totalDocuments);
+}
+
+// Redraw the topology; with changedNodeIds, only those nodes are replaced
+function updateClusterTopology(status, changedNodeIds = null) {
+    const container = elements.clusterTopology;
+    
+    if (changedNodeIds) {
+        status.nodes.filter(node => changedNodeIds.has(node.id)).forEach(node => {
+            const existing = container.querySelector(`[data-node-id="${node.id}"]`);
+            if (existing) {
+                existing.replaceWith(createTopologyNode(node));
+            }
+        });
+        return;
+    }
     
     const topology = document.createElement('div');
     topology.className = 'd-flex justify-content-center align-items-center flex-wrap';
     
     status.nodes.forEach(node => {
-        const nodeDiv = document.createElement('div');
-        nodeDiv.className = `topology-node topology-${node.role} ${node.status === 'offline' ? 'topology-offline' : ''}`;
-        nodeDiv.innerHTML = `
-            <div style="font-size: 12px;">${node.hostname}</div>
-            <div style="font-size: 10px;">${node.role}</div>
-            <div style="font-size: 10px;">${node.status}</div>
-        `;
-        nodeDiv.onclick = () => showNodeDetails(node.id);
-        topology.appendChild(nodeDiv);
+        topology.appendChild(createTopologyNode(node));
     });
     
-    container.appendChild(topology);
+    container.replaceChildren(topology);
+}
+
+function createTopologyNode(node) {
+    const nodeDiv = document.createElement('div');
+    nodeDiv.className = `topology-node topology-${node.role} ${node.status === 'offline' ? 'topology-offline' : ''}`;
+    nodeDiv.dataset.nodeId = node.id;
+    [[node.hostname, '12px'], [node.role, '10px'], [node.status, '10px']].forEach(([text, fontSize]) => {
+        const line = createTextElement('div', '', text);
+        line.style.fontSize = fontSize;
+        nodeDiv.appendChild(line);
+    });
+    nodeDiv.dataset.action = 'node-details';
+    return nodeDiv;
+}
+
+// Millisecond wall time of a member's last applied op, falling back to the
+// second-resolution optimeDate on servers without lastAppliedWallTime
+function memberAppliedTime(member) {
+    const applied = member.lastAppliedWallTime || member.optimeDate;
+    return applied ? new Date(applied).getTime() : null;
 }
 
 // Update replication table
 function updateReplicationTable(status) {
     const tbody = document.querySelector('#replicationTable tbody');
-    tbody.innerHTML = '';
+    const rows = document.createDocumentFragment();
     
     if (status.replicaSet && status.replicaSet.members) {
+        // Lag is measured against the primary's optime from the same replSetGetStatus
+        // snapshot, not against the browser clock
+        const primary = status.replicaSet.members.find(member => member.state === 1);
+        const primaryOptime = primary ? memberAppliedTime(primary) : null;
+        
         status.replicaSet.members.forEach(member => {
+            const optime = memberAppliedTime(member);
+            const lag = primaryOptime !== null && optime !== null ? Math.max(0, primaryOptime - optime) : 0;
             const row = document.createElement('tr');
-            row.innerHTML = `
-                <td>${member.name}</td>
-                <td><span class="badge bg-${getStateColor(member.state)}">${member.stateStr}</span></td>
-                <td><span class="badge bg-${member.health === 1 ? 'success' : 'danger'}">${member.health === 1 ? 'Healthy' : 'Unhealthy'}</span></td>
-                <td>${formatDuration(member.optimeDate ? (Date.now() - new Date(member.optimeDate).getTime()) : 0)}</td>
-                <td>${member.optimeDate ? new Date(member.optimeDate).toLocaleString() : 'N/A'}</td>
-            `;
-            tbody.appendChild(row);
+            const stateCell = document.createElement('td');
+            stateCell.appendChild(createTextElement('span', `badge bg-${getStateColor(member.state)}`, member.stateStr));
+            const healthCell = document.createElement('td');
+            healthCell.appendChild(createTextElement('span', `badge bg-${member.health === 1 ? 'success' : 'danger'}`,
+                member.health === 1 ? 'Healthy' : 'Unhealthy'));
+            row.append(
+                createTextElement('td', '', member.name),
+                stateCell,
+                healthCell,
+                createTextElement('td', '', formatDuration(lag)),
+                createTextElement('td', '', member.optimeDate ? DATE_TIME_FORMAT.format(new Date(member.optimeDate)) : 'N/A')
+            );
+            rows.appendChild(row);
         });
     }
+    
+    tbody.replaceChildren(rows);
 }
 
-// Update nodes tab
-function updateNodesTab(status) {
-    const container = document.getElementById('nodesContainer');
-    container.innerHTML = '';
+// Redraw the node cards; with changedNodeIds, only those cards are replaced
+function updateNodesTab(status, changedNodeIds = null) {
+    const container = elements.nodesContainer;
+    
+    if (changedNodeIds) {
+        status.nodes.filter(node => changedNodeIds.has(node.id)).forEach(node => {
+            const existing = container.querySelector(`[data-node-id="${node.id}"]`);
+            if (existing) {
+                existing.replaceWith(createNodeCard(node));
+            }
+        });
+        return;
+    }
     
+    const cards = document.createDocumentFragment();
     status.nodes.forEach(node => {
-        const nodeCard = createNodeCard(node);
-        container.appendChild(nodeCard);
+        cards.appendChild(createNodeCard(node));
     });
+    container.replaceChildren(cards);
 }
 
-// Create node card
+// Create node card from the static template; values are assigned as text,
+// so nothing coming from the server goes through the HTML parser
 function createNodeCard(node) {
-    const col = document.createElement('div');
-    col.className = 'col-md-6 col-lg-4 node-card';
-    
-    col.innerHTML = `
-        <div class="card">
-            <div class="node-header node-role-${node.role}">
-                <div>
-                    <h5 class="mb-1">${node.hostname}</h5>
-                    <small>${node.ip}:${node.port}</small>
-                </div>
-                <div>
-                    <span class="badge bg-light text-dark">${node.role.toUpperCase()}</span>
-                </div>
-            </div>
-            <div class="node-stats">
-                <div class="stat-item">
-                    <div class="stat-value ${node.status === 'online' ? 'text-success' : 'text-danger'}">
-                        <i class="bi bi-${node.status === 'online' ? 'check-circle' : 'x-circle'}"></i>
-                    </div>
-                    <div class="stat-label">Status</div>
-                </div>
-                ${node.status === 'online' && node.serverStatus ? `
-                    <div class="stat-item">
-                        <div class="stat-value">${node.connections ? node.connections.current : 'N/A'}</div>
-                        <div class="stat-label">Connections</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-value">${node.memory ? formatBytes(node.memory.resident * 1024 * 1024) : 'N/A'}</div>
-                        <div class="stat-label">Memory</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-value">${node.uptime ? formatDuration(node.uptime * 1000) : 'N/A'}</div>
-                        <div class="stat-label">Uptime</div>
-                    </div>
-                ` : ''}
-            </div>
-            <div class="card-footer">
-                <button class="btn btn-sm btn-outline-primary" onclick="showNodeDetails(${node.id})">
-                    <i class="bi bi-info-circle"></i> Details
-                </button>
-                <button class="btn btn-sm btn-outline-secondary" onclick="openSSHTab(${node.id})">
-                    <i class="bi bi-terminal"></i> SSH
-                </button>
-            </div>
-        </div>
-    `;
+    const col = nodeCardTemplate.content.firstElementChild.cloneNode(true);
+    const bind = (name) => col.querySelector(`[data-bind="${name}"]`);
+    const online = node.status === 'online';
+    col.dataset.nodeId = node.id;
+    
+    col.querySelector('.node-header').classList.add(`node-role-${node.role}`);
+    bind('hostname').textContent = node.hostname;
+    bind('address').textContent = `${node.ip}:${node.port}`;
+    bind('role').textContent = node.role.toUpperCase();
+    bind('statusValue').classList.add(online ? 'text-success' : 'text-danger');
+    bind('statusIcon').classList.add(online ? 'bi-check-circle' : 'bi-x-circle');
+    
+    if (online) {
+        bind('connections').textContent = node.connections ? node.connections.current : 'N/A';
+        bind('memory').textContent = node.memory ? formatBytes(node.memory.resident * 1024 * 1024) : 'N/A';
+        bind('uptime').textContent = node.uptime ? formatDuration(node.uptime * 1000) : 'N/A';
+    } else {
+        col.querySelectorAll('[data-online-only]').forEach(item => item.remove());
+    }
     
     return col;
 }
 
+// Options for the rolling time-series charts, which redraw on every monitoring
+// tick. Chart.js streams cheapest without per-point markers (hover hit areas
+// are kept) and when told the data is already normalized and gap-free, so it
+// skips re-validating every point on each update
+function lineChartOptions() {
+    return {
+        responsive: true,
+        maintainAspectRatio: false,
+        animation: false,
+        normalized: true,
+        spanGaps: true,
+        elements: {
+            point: {
+                radius: 0,
+                hitRadius: 6
+            }
+        },
+        scales: {
+            y: {
+                beginAtZero: true
+            }
+        }
+    };
+}
+
 // Initialize charts
 function initializeCharts() {
     // Operations chart
@@ -309,24 +553,16 @@ function initializeCharts() {
     charts.operations = new Chart(opsCtx, {
         type: 'line',
         data: {
-            labels: [],
+            labels: new Array(CHART_HISTORY_LENGTH).fill(''),
             datasets: [{
                 label: 'Operations/sec',
-                data: [],
+                data: new Array(CHART_HISTORY_LENGTH).fill(null),
                 borderColor: '#007bff',
                 backgroundColor: 'rgba(0, 123, 255, 0.1)',
                 tension: 0.4
             }]
         },
-        options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            scales: {
-                y: {
-                    beginAtZero: true
-                }
-            }
-        }
+        options: lineChartOptions()
     });
     
     // Memory chart
@@ -342,7 +578,8 @@ function initializeCharts() {
         },
         options: {
             responsive: true,
-            maintainAspectRatio: false
+            maintainAspectRatio: false,
+            animation: false
         }
     });
     
@@ -355,12 +592,13 @@ function initializeCharts() {
             datasets: [{
                 label: 'Storage (GB)',
                 data: [],
-                backgroundColor: '#17a2b8'
+                backgroundColor: []
             }]
         },
         options: {
             responsive: true,
             maintainAspectRatio: false,
+            animation: false,
             scales: {
                 y: {
                     beginAtZero: true
@@ -374,272 +612,669 @@ function initializeCharts() {
     charts.connections = new Chart(connCtx, {
         type: 'line',
         data: {
-            labels: [],
+            labels: new Array(CHART_HISTORY_LENGTH).fill(''),
             datasets: [{
                 label: 'Active Connections',
-                data: [],
+                data: new Array(CHART_HISTORY_LENGTH).fill(null),
                 borderColor: '#ffc107',
                 backgroundColor: 'rgba(255, 193, 7, 0.1)',
                 tension: 0.4
             }]
         },
-        options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            scales: {
-                y: {
-                    beginAtZero: true
-                }
-            }
+        options: lineChartOptions()
+    });
+}
+
+// Ask for a full frame once; the delta frames still arriving until it does
+// would otherwise each trigger another full frame
+function requestResync() {
+    lastFrameSeq = 0;
+    if (!resyncPending) {
+        resyncPending = true;
+        socket.emit('resync');
+    }
+}
+
+// Merge a monitoring frame into clusterState, asking for a full resync when a
+// delta frame does not directly follow the last one applied
+function applyClusterFrame(data) {
+    if (!data.full && (!clusterState || data.seq !== lastFrameSeq + 1)) {
+        requestResync();
+        return;
+    }
+    lastFrameSeq = data.seq;
+    
+    let changedNodeIds = null;
+    if (data.full) {
+        resyncPending = false;
+        // Index nodes by id so each delta is merged without scanning the list
+        clusterState = {
+            nodes: data.status.nodes,
+            nodesById: new Map(data.status.nodes.map(node => [node.id, node]))
+        };
+    } else {
+        if (data.status.nodes.some(delta => !clusterState.nodesById.has(delta.id))) {
+            requestResync();
+            return;
         }
+        
+        changedNodeIds = new Set();
+        data.status.nodes.forEach(delta => {
+            const node = clusterState.nodesById.get(delta.id);
+            Object.entries(delta).forEach(([field, value]) => {
+                if (value === null) {
+                    delete node[field];
+                } else {
+                    node[field] = value;
+                }
+            });
+            changedNodeIds.add(delta.id);
+        });
+    }
+    
+    // Chart points are recorded for every frame; the DOM is rendered at most
+    // once per animation frame however many frames arrived in between
+    updateCharts(clusterState.nodes, data.timestamp);
+    queueFrameRender({
+        ...data,
+        status: { ...data.status, nodes: clusterState.nodes },
+        changedNodeIds
     });
 }
 
-// Update dashboard data from real-time updates
+// Frame render waiting for the next animation frame; frames that arrive before
+// it runs are folded into it
+let pendingRender = null;
+
+function queueFrameRender(data) {
+    if (!pendingRender) {
+        pendingRender = data;
+        requestAnimationFrame(() => {
+            const render = pendingRender;
+            pendingRender = null;
+            updateDashboardData(render);
+        });
+        return;
+    }
+    
+    // Union the changed nodes (null means everything) and keep the newest
+    // status, plus the newest lag and stats any of the frames carried
+    const changedNodeIds = pendingRender.changedNodeIds && data.changedNodeIds
+        ? new Set([...pendingRender.changedNodeIds, ...data.changedNodeIds])
+        : null;
+    pendingRender = {
+        ...data,
+        replicationLag: data.replicationLag || pendingRender.replicationLag,
+        databaseStats: data.databaseStats || pendingRender.databaseStats,
+        changedNodeIds
+    };
+}
+
 function updateDashboardData(data) {
     if (data.status) {
         updateStatusCards(data.status);
-        updateClusterTopology(data.status);
+        updateClusterTopology(data.status, data.changedNodeIds);
         updateReplicationTable(data.status);
+        updateNodesTab(data.status, data.changedNodeIds);
     }
     
     if (data.replicationLag) {
         updateReplicationLag(data.replicationLag);
     }
     
-    if (data.metrics) {
-        updateCharts(data.metrics);
+    if (data.databaseStats) {
+        updateDatabaseStatsDisplay(data.databaseStats);
     }
 }
 
-// Update replication lag
+// Update replication lag; frames carry per-member lags in milliseconds,
+// parallel to the member names
 function updateReplicationLag(lagInfo) {
-    const maxLag = Math.max(...lagInfo.members.map(m => m.lagSeconds));
-    document.getElementById('replicationLag').textContent = formatDuration(maxLag * 1000);
+    const maxLag = Math.max(0, ...lagInfo.lags);
+    elements.replicationLag.textContent = formatDuration(maxLag);
 }
 
-// Update charts with new data
-function updateCharts(metrics) {
-    const now = new Date();
-    const timeLabel = now.toLocaleTimeString();
+// Charts with pending data, redrawn together on the next animation frame so a
+// burst of updates costs one layout and paint per chart
+const dirtyCharts = new Set();
+
+function scheduleChartUpdate(chart) {
+    if (dirtyCharts.size === 0) {
+        requestAnimationFrame(() => {
+            dirtyCharts.forEach(dirty => dirty.update('none'));
+            dirtyCharts.clear();
+        });
+    }
+    dirtyCharts.add(chart);
+}
+
+// Fixed palette indexed by a hash of the series label, so a host keeps its
+// colour across ticks, reloads and changes in node order
+const CHART_PALETTE = [
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b',
+    '#e377c2', '#7f7f7f', '#bcbd22', '#17becf', '#393b79', '#637939'
+];
+
+// Colour per label, hashed once; the storage chart asks for every host on each tick
+const labelColors = new Map();
+
+function colorForLabel(label) {
+    let color = labelColors.get(label);
+    if (color === undefined) {
+        // 32-bit FNV-1a
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < label.length; i++) {
+            hash = Math.imul(hash ^ label.charCodeAt(i), 0x01000193);
+        }
+        color = CHART_PALETTE[(hash >>> 0) % CHART_PALETTE.length];
+        labelColors.set(label, color);
+    }
+    return color;
+}
+
+// Update charts from the current node statuses
+function updateCharts(nodes, timestamp) {
+    // Label points with the server tick so every chart shares one time axis
+    const timeLabel = TIME_FORMAT.format(timestamp ? new Date(timestamp) : new Date());
     
     // Update operations chart
     if (charts.operations) {
-        const totalOps = Object.values(metrics).reduce((sum, node) => {
+        const totalOps = nodes.reduce((sum, node) => {
             if (node.opcounters) {
                 return sum + (node.opcounters.insert + node.opcounters.query + node.opcounters.update + node.opcounters.delete);
             }
             return sum;
         }, 0);
         
-        charts.operations.data.labels.push(timeLabel);
-        charts.operations.data.datasets[0].data.push(totalOps);
-        
-        // Keep only last 20 data points
-        if (charts.operations.data.labels.length > 20) {
-            charts.operations.data.labels.shift();
-            charts.operations.data.datasets[0].data.shift();
-        }
-        
-        charts.operations.update('none');
+        pushChartPoint(charts.operations, timeLabel, totalOps);
+        scheduleChartUpdate(charts.operations);
     }
     
     // Update memory chart
     if (charts.memory) {
-        const totalMemory = Object.values(metrics).reduce((sum, node) => {
+        const totalMemory = nodes.reduce((sum, node) => {
             return sum + (node.memory ? node.memory.resident : 0);
         }, 0);
         
         charts.memory.data.datasets[0].data = [totalMemory, Math.max(0, 8192 - totalMemory)]; // Assuming 8GB total
-        charts.memory.update('none');
+        scheduleChartUpdate(charts.memory);
     }
     
     // Update connections chart
     if (charts.connections) {
-        const totalConnections = Object.values(metrics).reduce((sum, node) => {
+        const totalConnections = nodes.reduce((sum, node) => {
             return sum + (node.connections ? node.connections.current : 0);
         }, 0);
         
-        charts.connections.data.labels.push(timeLabel);
-        charts.connections.data.datasets[0].data.push(totalConnections);
-        
-        if (charts.connections.data.labels.length > 20) {
-            charts.connections.data.labels.shift();
-            charts.connections.data.datasets[0].data.shift();
-        }
-        
-        charts.connections.update('none');
+        pushChartPoint(charts.connections, timeLabel, totalConnections);
+        scheduleChartUpdate(charts.connections);
+    }
+    
+    // Update storage chart, one bar per online node
+    if (charts.storage) {
+        const reporting = nodes.filter(node => node.dbStats);
+        charts.storage.data.labels = reporting.map(node => node.hostname);
+        charts.storage.data.datasets[0].data = reporting.map(node => node.dbStats.storageSize / (1024 * 1024 * 1024));
+        charts.storage.data.datasets[0].backgroundColor = reporting.map(node => colorForLabel(node.hostname));
+        scheduleChartUpdate(charts.storage);
     }
 }
 
+// Append a sample to a single-dataset time-series chart. The window is allocated
+// at full length up front (empty slots are null and not drawn), so the arrays
+// never grow or shrink; Chart.js draws category points in array order, so each
+// sample slides the window left in place with copyWithin
+function pushChartPoint(chart, label, value) {
+    const labels = chart.data.labels;
+    const data = chart.data.datasets[0].data;
+    
+    labels.copyWithin(0, 1);
+    data.copyWithin(0, 1);
+    labels[labels.length - 1] = label;
+    data[data.length - 1] = value;
+}
+
+// Query most recently submitted from the form; "Load more" fetches its next page
+let activeQuery = null;
+
+// Documents per page, matching the server's QUERY_RESULT_LIMIT
+const QUERY_PAGE_SIZE = 100;
+
 // Query form handler
-document.getElementById('queryForm').addEventListener('submit', async function(e) {
+document.getElementById('queryForm').addEventListener('submit', function(e) {
     e.preventDefault();
     
-    const nodeId = document.getElementById('queryNode').value;
-    const collection = document.getElementById('queryCollection').value;
-    const query = document.getElementById('queryText').value;
-    const resultsDiv = document.getElementById('queryResults');
-    const statsDiv = document.getElementById('queryStats');
-    
+    const query = elements.queryText.value;
     if (!query.trim()) {
         showNotification('Please enter a query', 'warning');
         return;
     }
     
+    activeQuery = {
+        query: query,
+        collection: elements.queryCollection.value,
+        nodeId: elements.queryNode.value,
+        operation: elements.queryOperation.value || undefined,
+        projection: elements.queryProjection.value || undefined
+    };
+    runQuery(0);
+});
+
+// Fetch one page of the active query. Page 0 replaces the results panel;
+// later pages are appended after the rows already shown
+async function runQuery(page) {
+    const resultsDiv = elements.queryResults;
+    const statsDiv = elements.queryStats;
+    const loadMore = resultsDiv.querySelector('.query-load-more');
+    
     try {
-        resultsDiv.textContent = 'Executing query...';
-        statsDiv.textContent = '';
+        if (page === 0) {
+            resultsDiv.textContent = 'Executing query...';
+            statsDiv.textContent = '';
+        } else if (loadMore) {
+            loadMore.disabled = true;
+            loadMore.textContent = 'Loading...';
+        }
+        const signal = replacePendingRequest('query');
         
-        const result = await apiRequest('/api/database/query', {
+        const response = await apiFetch('/api/database/query', {
             method: 'POST',
-            body: JSON.stringify({
-                query: query,
-                collection: collection,
-                nodeId: nodeId
-            })
+            signal,
+            body: JSON.stringify({ ...activeQuery, page })
         });
         
+        // Rows stream in as compact one-line JSON, appended at most once per
+        // frame; a row is only pretty-printed when clicked open
+        const pendingRows = document.createDocumentFragment();
+        let flushScheduled = false;
+        let firstRow = page === 0;
+        const flushRows = () => {
+            flushScheduled = false;
+            if (!pendingRows.hasChildNodes() || signal.aborted) {
+                return;
+            }
+            if (firstRow) {
+                resultsDiv.replaceChildren(pendingRows);
+                firstRow = false;
+            } else {
+                // Keep the rows above the "Load more" button while it is still shown
+                resultsDiv.insertBefore(pendingRows, resultsDiv.querySelector('.query-load-more'));
+            }
+        };
+        
+        let result = { success: false, error: 'Query response ended unexpectedly' };
+        await readNdjson(response, (line) => {
+            if (line.summary) {
+                result = line.summary;
+                return;
+            }
+            pendingRows.appendChild(createQueryRow(JSON.stringify(line.document)));
+            if (!flushScheduled) {
+                flushScheduled = true;
+                requestAnimationFrame(flushRows);
+            }
+        });
+        flushRows();
+        
         if (result.success) {
-            resultsDiv.textContent = JSON.stringify(result.result, null, 2);
-            statsDiv.textContent = `${result.count} documents, ${result.executionTime}ms`;
-            showNotification('Query executed successfully', 'success');
+            if (firstRow) {
+                resultsDiv.textContent = '';
+            }
+            if (loadMore) {
+                loadMore.remove();
+            }
+            const shown = page * QUERY_PAGE_SIZE + result.count;
+            statsDiv.textContent = `${shown}${result.hasMore ? '+' : ''} documents, ${result.executionTime}ms`;
+            if (result.hasMore) {
+                resultsDiv.appendChild(createLoadMoreButton(page + 1));
+            }
+            if (page === 0) {
+                showNotification('Query executed successfully', 'success');
+            }
         } else {
-            resultsDiv.textContent = `Error: ${result.error}`;
-            statsDiv.textContent = '';
+            if (page === 0) {
+                resultsDiv.textContent = `Error: ${result.error}`;
+                statsDiv.textContent = '';
+            } else {
+                resetLoadMoreButton(loadMore);
+            }
             showNotification('Query failed', 'danger');
         }
     } catch (error) {
+        // A newer query replaced this one and owns the results panel now
+        if (isAbortError(error)) {
+            return;
+        }
         console.error('Query error:', error);
-        resultsDiv.textContent = `Error: ${error.message}`;
+        if (page === 0) {
+            resultsDiv.textContent = `Error: ${error.message}`;
+        } else {
+            resetLoadMoreButton(loadMore);
+        }
         showNotification('Query failed', 'danger');
     }
-});
+}
+
+function createQueryRow(compactJson) {
+    const row = createTextElement('div', 'query-row', compactJson);
+    row.title = 'Click to expand';
+    row.onclick = () => {
+        const expanded = row.classList.toggle('expanded');
+        row.textContent = expanded ? JSON.stringify(JSON.parse(compactJson), null, 2) : compactJson;
+    };
+    return row;
+}
+
+function createLoadMoreButton(nextPage) {
+    const button = createTextElement('button', 'btn btn-sm btn-outline-primary mt-2 query-load-more', 'Load more');
+    button.type = 'button';
+    button.onclick = () => runQuery(nextPage);
+    return button;
+}
+
+function resetLoadMoreButton(button) {
+    if (button && button.isConnected) {
+        button.disabled = false;
+        button.textContent = 'Load more';
+    }
+}
 
 // SSH form handler
 document.getElementById('sshForm').addEventListener('submit', async function(e) {
     e.preventDefault();
     
-    const nodeId = document.getElementById('sshNode').value;
-    const command = document.getElementById('sshCommand').value;
-    const outputDiv = document.getElementById('sshOutput');
+    const nodeId = elements.sshNode.value;
+    const command = elements.sshCommand.value;
+    const outputDiv = elements.sshOutput;
     
     if (!command.trim()) {
         showNotification('Please enter a command', 'warning');
         return;
     }
     
+    // Each command gets its own entry in the output log; output streams into
+    // that entry as the command produces it
+    const header = `$ ${command}\n`;
+    const entry = appendSSHOutput(outputDiv, header, 'Executing command...');
+    let output = '';
+    let dropped = 0;
+    let renderScheduled = false;
+    
+    // Only the tail is ever shown, so older text is discarded as it streams in,
+    // and the entry is rewritten at most once per animation frame
+    const render = () => {
+        renderScheduled = false;
+        setSSHOutputText(entry, header, output, dropped);
+    };
+    const appendOutput = (text) => {
+        output += text;
+        if (output.length > 2 * SSH_OUTPUT_MAX_CHARS) {
+            dropped += output.length - SSH_OUTPUT_MAX_CHARS;
+            output = output.slice(-SSH_OUTPUT_MAX_CHARS);
+        }
+        if (!renderScheduled) {
+            renderScheduled = true;
+            requestAnimationFrame(render);
+        }
+    };
+    
     try {
-        outputDiv.textContent = 'Executing command...';
-        
-        const result = await apiRequest(`/api/nodes/${nodeId}/ssh`, {
+        const response = await apiFetch(`/api/nodes/${nodeId}/ssh`, {
             method: 'POST',
+            headers: {
+                'Authorization': `Bearer ${authToken}`,
+                'Content-Type': 'application/json',
+                'Accept': 'application/x-ndjson'
+            },
             body: JSON.stringify({ command })
         });
         
+        let result = { success: false, error: 'SSH response ended unexpectedly' };
+        if ((response.headers.get('Content-Type') || '').startsWith('application/x-ndjson')) {
+            await readNdjson(response, (line) => {
+                if (line.summary) {
+                    result = line.summary;
+                } else {
+                    appendOutput(line.stdout || line.stderr || '');
+                }
+            });
+        } else {
+            // Requests rejected before the command started are plain JSON
+            const body = await response.json();
+            result = { success: false, error: body.details || body.error };
+        }
+        
         if (result.success) {
-            outputDiv.textContent = result.output || 'Command completed with no output';
+            if (!output && dropped === 0) {
+                appendOutput('Command completed with no output');
+            }
             showNotification('Command executed successfully', 'success');
         } else {
-            outputDiv.textContent = `Error: ${result.error}\n${result.output || ''}`;
+            appendOutput(`${output && !output.endsWith('\n') ? '\n' : ''}` +
+                (result.error ? `Error: ${result.error}` : `Exited with code ${result.exitCode}`));
             showNotification('Command failed', 'danger');
         }
+        render();
     } catch (error) {
         console.error('SSH error:', error);
-        outputDiv.textContent = `Error: ${error.message}`;
+        setSSHOutputText(entry, header, `Error: ${error.message}`);
         showNotification('SSH command failed', 'danger');
     }
 });
 
+// Fill an SSH output entry with its command header and the tail of the output,
+// truncating from the front so one command that prints megabytes cannot swamp
+// the log's DOM. omitted counts output the caller already discarded
+function setSSHOutputText(entry, header, output, omitted = 0) {
+    if (output.length > SSH_OUTPUT_MAX_CHARS) {
+        omitted += output.length - SSH_OUTPUT_MAX_CHARS;
+        output = output.slice(-SSH_OUTPUT_MAX_CHARS);
+    }
+    entry.textContent = header + (omitted > 0 ? `[${formatNumber(omitted)} characters omitted]\n` : '') + output;
+}
+
+// Append an entry to the SSH output log, dropping the oldest past the cap and
+// following the bottom only if the user had not scrolled up
+function appendSSHOutput(outputDiv, header, output) {
+    if (!outputDiv.firstElementChild) {
+        outputDiv.textContent = '';
+    }
+    
+    const atBottom = outputDiv.scrollHeight - outputDiv.scrollTop - outputDiv.clientHeight < 5;
+    const entry = document.createElement('div');
+    entry.className = 'ssh-output-entry';
+    setSSHOutputText(entry, header, output);
+    outputDiv.appendChild(entry);
+    
+    while (outputDiv.childElementCount > SSH_OUTPUT_MAX_ENTRIES) {
+        outputDiv.firstElementChild.remove();
+    }
+    if (atBottom) {
+        outputDiv.scrollTop = outputDiv.scrollHeight;
+    }
+    return entry;
+}
+
+// Node list the dropdowns were last built from
+let dropdownNodesKey = null;
+
 // Populate dropdowns
 function populateDropdowns() {
     if (config.mongodb_cluster && config.mongodb_cluster.nodes) {
-        // Query node dropdown
-        const queryNodeSelect = document.getElementById('queryNode');
-        queryNodeSelect.innerHTML = '<option value="replica_set">Replica Set</option>';
+        // Configuration reloads that leave the nodes as they were keep the
+        // existing options, and with them whatever the user had selected
+        const nodesKey = config.mongodb_cluster.nodes
+            .map(node => `${node.id}\u0000${node.hostname}\u0000${node.role}\u0000${node.ip}`)
+            .join('\u0001');
+        if (nodesKey === dropdownNodesKey) {
+            return;
+        }
+        dropdownNodesKey = nodesKey;
         
-        // SSH node dropdown
-        const sshNodeSelect = document.getElementById('sshNode');
-        sshNodeSelect.innerHTML = '';
+        // Build both option lists off-DOM and swap each select's contents once
+        const queryOptions = document.createDocumentFragment();
+        const sshOptions = document.createDocumentFragment();
+        queryOptions.appendChild(new Option('Replica Set', 'replica_set'));
         
         config.mongodb_cluster.nodes.forEach(node => {
-            const queryOption = document.createElement('option');
-            queryOption.value = node.id;
-            queryOption.textContent = `${node.hostname} (${node.role})`;
-            queryNodeSelect.appendChild(queryOption);
-            
-            const sshOption = document.createElement('option');
-            sshOption.value = node.id;
-            sshOption.textContent = `${node.hostname} (${node.ip})`;
-            sshNodeSelect.appendChild(sshOption);
+            queryOptions.appendChild(new Option(`${node.hostname} (${node.role})`, node.id));
+            sshOptions.appendChild(new Option(`${node.hostname} (${node.ip})`, node.id));
         });
+        
+        const querySelection = elements.queryNode.value;
+        const sshSelection = elements.sshNode.value;
+        elements.queryNode.replaceChildren(queryOptions);
+        elements.sshNode.replaceChildren(sshOptions);
+        // Keep the previous choice if that node is still configured
+        restoreSelection(elements.queryNode, querySelection);
+        restoreSelection(elements.sshNode, sshSelection);
+    }
+}
+
+function restoreSelection(select, value) {
+    if (Array.from(select.options).some(option => option.value === value)) {
+        select.value = value;
     }
 }
 
 // Configuration management
+elements.configTab.addEventListener('shown.bs.tab', renderConfigForm);
+elements.rawConfig.addEventListener('input', () => {
+    configEditorDirty = true;
+});
+elements.replicaSetName.addEventListener('input', () => {
+    configEditorDirty = true;
+});
+
 function updateRawConfig() {
-    document.getElementById('rawConfig').value = JSON.stringify(config, null, 2);
+    elements.rawConfig.value = JSON.stringify(config, null, 2);
 }
 
 function updateNodesConfig() {
-    const container = document.getElementById('nodesConfig');
-    container.innerHTML = '';
+    const container = elements.nodesConfig;
+    const nodeForms = document.createDocumentFragment();
     
     if (config.mongodb_cluster && config.mongodb_cluster.nodes) {
         config.mongodb_cluster.nodes.forEach((node, index) => {
             const nodeDiv = document.createElement('div');
             nodeDiv.className = 'config-node';
-            nodeDiv.innerHTML = `
-                <div class="config-node-header">
-                    <h6>Node ${node.id} - ${node.hostname}</h6>
-                    <span class="badge bg-${node.role === 'primary' ? 'success' : 'primary'}">${node.role}</span>
-                </div>
-                <div class="row">
-                    <div class="col-md-6">
-                        <label class="form-label">IP Address</label>
-                        <input type="text" class="form-control" value="${node.ip}" onchange="updateNodeConfig(${index}, 'ip', this.value)">
-                    </div>
-                    <div class="col-md-6">
-                        <label class="form-label">Port</label>
-                        <input type="number" class="form-control" value="${node.port}" onchange="updateNodeConfig(${index}, 'port', parseInt(this.value))">
-                    </div>
-                </div>
-            `;
-            container.appendChild(nodeDiv);
+            
+            const header = createTextElement('div', 'config-node-header');
+            header.append(
+                createTextElement('h6', '', `Node ${node.id} - ${node.hostname}`),
+                createTextElement('span', `badge bg-${node.role === 'primary' ? 'success' : 'primary'}`, node.role)
+            );
+            
+            const fields = createTextElement('div', 'row');
+            fields.append(
+                createConfigField('IP Address', 'text', node.ip, value => updateNodeConfig(index, 'ip', value)),
+                createConfigField('Port', 'number', node.port, value => updateNodeConfig(index, 'port', parseInt(value)))
+            );
+            
+            nodeDiv.append(header, fields);
+            nodeForms.appendChild(nodeDiv);
         });
     }
+    
+    container.replaceChildren(nodeForms);
+}
+
+function createConfigField(label, type, value, onChange) {
+    const column = createTextElement('div', 'col-md-6');
+    const input = document.createElement('input');
+    input.type = type;
+    input.className = 'form-control';
+    input.value = value;
+    input.onchange = () => onChange(input.value);
+    column.append(createTextElement('label', 'form-label', label), input);
+    return column;
 }
 
 function updateNodeConfig(nodeIndex, field, value) {
     if (config.mongodb_cluster && config.mongodb_cluster.nodes[nodeIndex]) {
         config.mongodb_cluster.nodes[nodeIndex][field] = value;
+        configEditorDirty = true;
         updateRawConfig();
     }
 }
 
 async function saveConfiguration() {
+    if (configSaveInFlight) {
+        return;
+    }
+    
+    const rawConfig = elements.rawConfig.value;
+    let newConfig;
     try {
-        const rawConfig = document.getElementById('rawConfig').value;
-        const newConfig = JSON.parse(rawConfig);
-        
-        await apiRequest('/api/config', {
+        newConfig = JSON.parse(rawConfig);
+    } catch (error) {
+        showNotification('Configuration is not valid JSON', 'danger');
+        return;
+    }
+    
+    configSaveInFlight = true;
+    try {
+        // The editor text is already JSON, so post it as-is rather than
+        // re-serializing the parsed object
+        const result = await apiRequest('/api/config', {
             method: 'POST',
-            body: JSON.stringify(newConfig)
+            headers: {
+                'Authorization': `Bearer ${authToken}`,
+                'Content-Type': 'application/json',
+                'X-Socket-Id': socket ? socket.id : ''
+            },
+            body: rawConfig
         });
+        if (!result.success) {
+            throw new Error(result.details || result.error);
+        }
         
-        config = newConfig;
-        updateNodesConfig();
-        populateDropdowns();
+        // Patch the page in place; the socket, charts and cluster state carry on
+        // and the next monitoring frame reflects the reconnected nodes
+        applyConfiguration(newConfig);
         showNotification('Configuration saved successfully', 'success');
     } catch (error) {
         console.error('Save configuration error:', error);
         showNotification('Failed to save configuration', 'danger');
+    } finally {
+        configSaveInFlight = false;
     }
 }
 
+// Click handlers for elements marked with data-action. One listener on the
+// document routes them all, so node cards and topology nodes rebuilt on each
+// update need no per-element binding
+const ACTION_HANDLERS = {
+    'logout': (target, e) => {
+        e.preventDefault();
+        logout();
+    },
+    'clear-ssh-output': () => clearSSHOutput(),
+    'ssh-command': target => setSSHCommand(target.dataset.command),
+    'save-config': () => saveConfiguration(),
+    'reload-config': () => loadConfiguration(),
+    'node-details': target => showNodeDetails(target.closest('[data-node-id]').dataset.nodeId),
+    'node-ssh': target => openSSHTab(target.closest('[data-node-id]').dataset.nodeId)
+};
+
+document.addEventListener('click', function(e) {
+    const target = e.target.closest('[data-action]');
+    const handler = target && ACTION_HANDLERS[target.dataset.action];
+    if (handler) {
+        handler(target, e);
+    }
+});
+
 // Utility functions
+
+// Locale formatters are built once; constructing one per call resolves the
+// locale data again on every chart tick and table refresh
+const NUMBER_FORMAT = new Intl.NumberFormat();
+const TIME_FORMAT = new Intl.DateTimeFormat(undefined, { timeStyle: 'medium' });
+const DATE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, { dateStyle: 'short', timeStyle: 'medium' });
+
 function formatNumber(num) {
-    return new Intl.NumberFormat().format(num);
+    return NUMBER_FORMAT.format(num);
 }
 
 function formatBytes(bytes) {
@@ -656,6 +1291,18 @@ function formatDuration(ms) {
     return Math.round(ms / 3600000) + 'h';
 }
 
+// Create an element whose content is set as text, never parsed as HTML
+function createTextElement(tag, className = '', text = '') {
+    const element = document.createElement(tag);
+    if (className) {
+        element.className = className;
+    }
+    if (text !== '') {
+        element.textContent = text;
+    }
+    return element;
+}
+
 function getStateColor(state) {
     switch (state) {
         case 1: return 'success'; // PRIMARY
@@ -666,30 +1313,49 @@ function getStateColor(state) {
 }
 
 function showNotification(message, type = 'info') {
+    const key = `${type}:${message}`;
+    const existing = activeNotifications.get(key);
+    if (existing) {
+        clearTimeout(existing.timer);
+        existing.timer = setTimeout(existing.dismiss, NOTIFICATION_TIMEOUT_MS);
+        return;
+    }
+    
     const alertDiv = document.createElement('div');
     alertDiv.className = `alert alert-${type} alert-floating alert-dismissible fade show`;
-    alertDiv.innerHTML = `
-        ${message}
-        <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-    `;
+    const closeButton = createTextElement('button', 'btn-close');
+    closeButton.type = 'button';
+    closeButton.dataset.bsDismiss = 'alert';
+    alertDiv.append(message, closeButton);
+    
+    const entry = {
+        dismiss: () => {
+            if (alertDiv.parentNode) {
+                alertDiv.remove();
+            }
+            activeNotifications.delete(key);
+        },
+        timer: null
+    };
+    alertDiv.addEventListener('closed.bs.alert', () => {
+        clearTimeout(entry.timer);
+        activeNotifications.delete(key);
+    });
     
     document.body.appendChild(alertDiv);
+    activeNotifications.set(key, entry);
     
     // Auto-dismiss after 5 seconds
-    setTimeout(() => {
-        if (alertDiv.parentNode) {
-            alertDiv.remove();
-        }
-    }, 5000);
+    entry.timer = setTimeout(entry.dismiss, NOTIFICATION_TIMEOUT_MS);
 }
 
 // SSH helper functions
 function setSSHCommand(command) {
-    document.getElementById('sshCommand').value = command;
+    elements.sshCommand.value = command;
 }
 
 function clearSSHOutput() {
-    document.getElementById('sshOutput').textContent = 'Ready for SSH commands...';
+    elements.sshOutput.textContent = 'Ready for SSH commands...';
 }
 
 function openSSHTab(nodeId) {
@@ -698,7 +1364,7 @@ function openSSHTab(nodeId) {
     sshTab.show();
     
     // Select the node
-    document.getElementById('sshNode').value = nodeId;
+    elements.sshNode.value = nodeId;
 }
 
 function showNodeDetails(nodeId) {
@@ -710,23 +1376,8 @@ function showNodeDetails(nodeId) {
     showNotification(`Showing details for node ${nodeId}`, 'info');
 }
 
-// Periodic updates
-function startPeriodicUpdates() {
-    updateInterval = setInterval(async () => {
-        try {
-            await updateClusterStatus();
-            await updateDatabaseStats();
-        } catch (error) {
-            console.error('Periodic update error:', error);
-        }
-    }, 30000); // Update every 30 seconds
-}
-
 // Cleanup on page unload
 window.addEventListener('beforeunload', function() {
-    if (updateInterval) {
-        clearInterval(updateInterval);
-    }
     if (socket) {
         socket.disconnect();
     }
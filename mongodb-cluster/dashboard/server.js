@@ -7,10 +7,13 @@
 
 const express = require('express');
 const http = require('http');
+const zlib = require('zlib');
 const socketIo = require('socket.io');
+const msgpackParser = require('socket.io-msgpack-parser');
 const path = require('path');
+const crypto = require('crypto');
 const fs = require('fs').promises;
-const { MongoClient } = require('mongodb');
+const { MongoClient, MongoNetworkError, MongoServerSelectionError, BSON } = require('mongodb');
 const bodyParser = require('body-parser');
 const cors = require('cors');
 const helmet = require('helmet');
@@ -19,7 +22,6 @@ const morgan = require('morgan');
 const bcrypt = require('bcryptjs');
 const jwt = require('jsonwebtoken');
 const { Client } = require('ssh2');
-const cron = require('node-cron');
 const winston = require('winston');
 const moment = require('moment');
 
@@ -47,6 +49,13 @@ const logger = winston.createLogger({
     ]
 });
 
+// JWT signing secret, resolved once; without JWT_SECRET every restart gets a
+// fresh random secret instead of a guessable built-in default
+const JWT_SECRET = process.env.JWT_SECRET || crypto.randomBytes(32).toString('hex');
+if (!process.env.JWT_SECRET) {
+    logger.warn('JWT_SECRET is not set; using a random secret, so sessions will not survive a restart');
+}
+
 // Express app setup
 const app = express();
 const server = http.createServer(app);
@@ -54,7 +63,13 @@ const io = socketIo(server, {
     cors: {
         origin: "*",
         methods: ["GET", "POST"]
-    }
+    },
+    // Room broadcasts encode each packet once and reuse the websocket frame for
+    // every recipient; per-message deflate would recompress it per socket
+    perMessageDeflate: false,
+    // MessagePack frames keep the numeric-heavy monitoring payload binary; the
+    // page loads the matching socket.io.msgpack client bundle
+    parser: msgpackParser
 });
 
 // Middleware
@@ -62,8 +77,8 @@ app.use(helmet({
     contentSecurityPolicy: {
         directives: {
             defaultSrc: ["'self'"],
-            scriptSrc: ["'self'", "'unsafe-inline'", "'unsafe-eval'", "https://cdn.jsdelivr.net"],
-            styleSrc: ["'self'", "'unsafe-inline'", "https://cdn.jsdelivr.net", "https://fonts.googleapis.com"],
+            scriptSrc: ["'self'", "'unsafe-inline'", "'unsafe-eval'"],
+            styleSrc: ["'self'", "'unsafe-inline'", "https://fonts.googleapis.com"],
             fontSrc: ["'self'", "https://fonts.gstatic.com"],
             imgSrc: ["'self'", "data:", "https:"],
             connectSrc: ["'self'", "ws:", "wss:"]
@@ -72,24 +87,189 @@ app.use(helmet({
 }));
 app.use(compression());
 app.use(cors());
+// Event stream URLs may carry a JWT as ?token=; keep it out of the access log
+morgan.token('url', req => (req.originalUrl || req.url).replace(/([?&]token=)[^&]*/, '$1[redacted]'));
 app.use(morgan('combined', { stream: { write: message => logger.info(message.trim()) } }));
-app.use(bodyParser.json({ limit: '50mb' }));
-app.use(bodyParser.urlencoded({ extended: true, limit: '50mb' }));
+// Request bodies are parsed synchronously on the event loop, so keep them small;
+// queries, SSH commands and the cluster config are all well under this
+app.use(bodyParser.json({ limit: '1mb' }));
+app.use(bodyParser.urlencoded({ extended: true, limit: '1mb' }));
 
-// Static files
-app.use(express.static(path.join(__dirname, 'public')));
+// Static files. index.html is rendered once at startup with content-hashed
+// asset URLs and served from memory; hashed asset requests can then be cached
+// by the browser indefinitely, while the page itself is always revalidated
+const PUBLIC_DIR = path.join(__dirname, 'public');
+const VERSIONED_ASSETS = ['css/dashboard.css', 'js/dashboard.js'];
+let indexHtml = null;
+
+// Browser libraries served from node_modules under /vendor/<package>/ rather
+// than hotlinked from a CDN, mapped to the directory each ships its builds in
+const NODE_MODULES_DIR = path.join(__dirname, 'node_modules');
+const VENDOR_PACKAGES = {
+    'bootstrap': 'dist',
+    'bootstrap-icons': 'font',
+    'chart.js': 'dist',
+    'chartjs-adapter-moment': 'dist',
+    'moment': 'min'
+};
+
+async function renderIndexHtml() {
+    let html = await fs.readFile(path.join(PUBLIC_DIR, 'index.html'), 'utf8');
+    for (const asset of VERSIONED_ASSETS) {
+        const content = await fs.readFile(path.join(PUBLIC_DIR, asset));
+        const hash = crypto.createHash('sha1').update(content).digest('hex').slice(0, 12);
+        html = html.replace(`"${asset}"`, `"${asset}?v=${hash}"`);
+    }
+    
+    // Vendor URLs are versioned by the installed package version
+    const vendorVersions = {};
+    for (const pkg of Object.keys(VENDOR_PACKAGES)) {
+        const manifest = await fs.readFile(path.join(NODE_MODULES_DIR, pkg, 'package.json'), 'utf8');
+        vendorVersions[pkg] = JSON.parse(manifest).version;
+    }
+    html = html.replace(/"vendor\/([^/"]+)\/([^"]+)"/g,
+        (match, pkg, file) => `"vendor/${pkg}/${file}?v=${vendorVersions[pkg]}"`);
+    
+    // Compress once here instead of in the compression middleware on every load
+    const body = Buffer.from(html);
+    indexHtml = {
+        // Weak, since the same page is served under three content encodings
+        etag: `W/"${crypto.createHash('sha256').update(body).digest('hex').slice(0, 32)}"`,
+        identity: body,
+        br: zlib.brotliCompressSync(body, {
+            params: { [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY }
+        }),
+        gzip: zlib.gzipSync(body, { level: zlib.constants.Z_BEST_COMPRESSION })
+    };
+}
+
+app.get(['/', '/index.html'], (req, res, next) => {
+    if (!indexHtml) {
+        return next();
+    }
+    
+    const encoding = req.acceptsEncodings('br', 'gzip', 'identity') || 'identity';
+    res.set('Cache-Control', 'no-cache');
+    res.vary('Accept-Encoding');
+    // The ETag is computed once at render time instead of hashing the body on
+    // every response; revalidations that match get an empty 304
+    res.set('ETag', indexHtml.etag);
+    if (req.fresh) {
+        return res.status(304).end();
+    }
+    if (encoding !== 'identity') {
+        res.set('Content-Encoding', encoding);
+    }
+    res.type('html').send(indexHtml[encoding]);
+});
+
+function setVersionedCacheHeaders(res) {
+    if (res.req.query.v) {
+        res.set('Cache-Control', 'public, max-age=31536000, immutable');
+    }
+}
+
+app.use(express.static(PUBLIC_DIR, { setHeaders: setVersionedCacheHeaders }));
+for (const [pkg, dir] of Object.entries(VENDOR_PACKAGES)) {
+    app.use(`/vendor/${pkg}`, express.static(path.join(NODE_MODULES_DIR, pkg, dir), {
+        setHeaders: setVersionedCacheHeaders
+    }));
+}
 
 // Configuration
 let config = {};
+let nodesById = new Map();  // Configured nodes keyed by id as it appears in URLs
+let configJson = '{}';      // config serialized once per change for the API responses
 let mongoClients = {};
-let clusterStatus = {};
-let realTimeMetrics = {};
+
+// Cluster status is shared by every dashboard client and the monitoring broadcast,
+// so cache it briefly and coalesce concurrent refreshes into one round of commands
+const STATUS_CACHE_TTL_MS = 1000;
+const STATUS_STALE_MAX_MS = 10000;  // Serve the last good status this long while the primary is unreachable
+let statusCache = { timestamp: 0, payload: null, body: null, pending: null };
+const DB_STATS_CACHE_TTL_MS = 30000;  // Collection counts move slowly; refresh them every few monitoring ticks
+let dbStatsCache = { timestamp: 0, payload: null, body: null, pending: null };
+
+// JSON for a cached payload, serialized once per refresh rather than once per
+// response; anything else (e.g. a stale-flagged copy) is serialized on demand
+function cachedJson(cache, payload) {
+    return payload === cache.payload ? cache.body : JSON.stringify(payload);
+}
+
+// serverStatus with the heavy sections suppressed; status views only read
+// uptime, connections, mem, network and opcounters
+const SERVER_STATUS_SUMMARY = {
+    serverStatus: 1,
+    wiredTiger: 0,
+    tcmalloc: 0,
+    metrics: 0,
+    locks: 0,
+    logicalSessionRecordCache: 0,
+    repl: 0,
+    sharding: 0,
+    storageEngine: 0,
+    electionMetrics: 0,
+    flowControl: 0,
+    transactions: 0
+};
+
+// Query console operators that run server-side JavaScript or write data
+const FORBIDDEN_QUERY_OPERATORS = new Set(['$where', '$function', '$accumulator', '$out', '$merge']);
+const QUERY_MAX_TIME_MS = 5000;
+const QUERY_RESULT_LIMIT = 100;
+
+// Forbidden-operator verdicts for recently submitted query texts, oldest first
+const QUERY_CHECK_CACHE_SIZE = 512;
+const queryCheckCache = new Map();
+
+const QUERY_MAX_PAGE = 1000;
+
+// Query console operations allowed by name; each yields documents as an async iterable.
+// Results come a page of QUERY_RESULT_LIMIT at a time; one extra document is
+// requested to tell whether another page follows. batchSize covers the whole
+// page so it arrives in the first reply instead of the server's default
+// 101-document batch plus a getMore
+const QUERY_OPERATIONS = {
+    find: (collection, filter, { projection, skip }) => collection
+        .find(filter, { projection, maxTimeMS: QUERY_MAX_TIME_MS, batchSize: QUERY_RESULT_LIMIT + 1 })
+        .skip(skip)
+        .limit(QUERY_RESULT_LIMIT + 1),
+    aggregate: (collection, pipeline, { skip }) => collection
+        .aggregate(pipeline, { maxTimeMS: QUERY_MAX_TIME_MS, batchSize: QUERY_RESULT_LIMIT + 1 })
+        .skip(skip)
+        .limit(QUERY_RESULT_LIMIT + 1),
+    countDocuments: async function* (collection, filter) {
+        yield { count: await collection.countDocuments(filter, { maxTimeMS: QUERY_MAX_TIME_MS }) };
+    }
+};
+
+// SSH connections are kept per node so repeated commands skip the TCP/SSH handshake.
+// Keepalives hold an idle connection open, so it is kept long enough to span
+// the pauses of someone working through commands in the SSH tab
+const SSH_IDLE_TIMEOUT_MS = 5 * 60 * 1000;
+const sshPool = new Map();
+
+// sshd caps sessions per connection (MaxSessions, default 10); commands beyond
+// this many per node wait for a free channel instead of failing to open one
+const SSH_MAX_CHANNELS_PER_NODE = 8;
+const sshChannelSlots = new Map();
+
+// Open /api/replication/lag/stream responses
+const lagStreamClients = new Set();
+
+// Install a configuration and index its nodes for route lookups
+function applyConfig(newConfig) {
+    config = newConfig;
+    configJson = JSON.stringify(config);
+    const nodes = (config.mongodb_cluster && config.mongodb_cluster.nodes) || [];
+    nodesById = new Map(nodes.map(node => [String(node.id), node]));
+}
 
 // Load configuration
 async function loadConfig() {
     try {
         const configData = await fs.readFile('../config/accounts.json', 'utf8');
-        config = JSON.parse(configData);
+        applyConfig(JSON.parse(configData));
         logger.info('Configuration loaded successfully');
         return config;
     } catch (error) {
@@ -98,6 +278,25 @@ async function loadConfig() {
     }
 }
 
+// Pooled clients live for the whole process; they are only replaced when the
+// cluster configuration changes
+async function closeMongoConnections() {
+    const clients = Object.entries(mongoClients);
+    await Promise.all(clients.map(async ([name, client]) => {
+        try {
+            await client.close();
+        } catch (error) {
+            logger.warn(`Failed to close MongoDB client ${name}: ${error.message}`);
+        }
+        delete mongoClients[name];
+    }));
+    nodeDbStatsCache.clear();
+}
+
+// Compress replies on the wire; serverStatus, replSetGetStatus and query results
+// are verbose BSON. zlib is built into the driver, unlike snappy and zstd
+const WIRE_COMPRESSION = { compressors: ['zlib'], zlibCompressionLevel: 3 };
+
 // Setup MongoDB connections
 async function setupMongoConnections() {
     try {
@@ -109,20 +308,27 @@ async function setupMongoConnections() {
         
         mongoClients.replicaSet = new MongoClient(replicaSetUri, {
             maxPoolSize: 10,
+            minPoolSize: 2,
+            waitQueueTimeoutMS: 2000,
             serverSelectionTimeoutMS: 5000,
             socketTimeoutMS: 45000,
+            ...WIRE_COMPRESSION,
+            appName: 'cluster-dashboard'
         });
         
-        await mongoClients.replicaSet.connect();
-        
-        // Connect to individual nodes
-        for (const node of config.mongodb_cluster.nodes) {
+        // Node connections are independent, so establish them concurrently;
+        // one unreachable node then costs a single server selection timeout
+        const nodeConnections = config.mongodb_cluster.nodes.map(async (node) => {
             const nodeUri = `mongodb://${node.user}:${node.password}@${node.ip}:${node.port}/${config.hr_database.name}`;
             mongoClients[`node_${node.id}`] = new MongoClient(nodeUri, {
                 maxPoolSize: 5,
+                minPoolSize: 1,
+                waitQueueTimeoutMS: 2000,
                 serverSelectionTimeoutMS: 3000,
                 socketTimeoutMS: 30000,
-                directConnection: true
+                directConnection: true,
+                ...WIRE_COMPRESSION,
+                appName: 'cluster-dashboard'
             });
             
             try {
@@ -131,7 +337,9 @@ async function setupMongoConnections() {
             } catch (error) {
                 logger.error(`Failed to connect to node ${node.id}:`, error);
             }
-        }
+        });
+        
+        await Promise.all([mongoClients.replicaSet.connect(), ...nodeConnections]);
         
         logger.info('MongoDB connections established');
     } catch (error) {
@@ -143,13 +351,22 @@ async function setupMongoConnections() {
 // Authentication middleware
 function authenticateToken(req, res, next) {
     const authHeader = req.headers['authorization'];
-    const token = authHeader && authHeader.split(' ')[1];
-    
-    if (!token) {
+    verifyToken(authHeader && authHeader.split(' ')[1], req, res, next);
+}
+
+// EventSource cannot set request headers, so event streams also accept the JWT
+// as a ?token= query parameter
+function authenticateStreamToken(req, res, next) {
+    const authHeader = req.headers['authorization'];
+    verifyToken(authHeader ? authHeader.split(' ')[1] : req.query.token, req, res, next);
+}
+
+function verifyToken(token, req, res, next) {
+    if (typeof token !== 'string' || !token) {
         return res.sendStatus(401);
     }
     
-    jwt.verify(token, process.env.JWT_SECRET || 'dashboard-secret-key', (err, user) => {
+    jwt.verify(token, JWT_SECRET, (err, user) => {
         if (err) return res.sendStatus(403);
         req.user = user;
         next();
@@ -170,7 +387,7 @@ app.post('/api/auth/login', async (req, res) => {
         if (username === validUsername && password === validPassword) {
             const token = jwt.sign(
                 { username, role: 'admin' },
-                process.env.JWT_SECRET || 'dashboard-secret-key',
+                JWT_SECRET,
                 { expiresIn: '24h' }
             );
             
@@ -191,14 +408,40 @@ app.post('/api/auth/login', async (req, res) => {
 // Cluster status
 app.get('/api/cluster/status', authenticateToken, async (req, res) => {
     try {
-        const status = await getClusterStatus();
-        res.json(status);
+        const status = await getCachedClusterStatus();
+        res.type('application/json').send(cachedJson(statusCache, status));
     } catch (error) {
         logger.error('Failed to get cluster status:', error);
         res.status(500).json({ error: 'Failed to get cluster status' });
     }
 });
 
+// Everything the dashboard needs on first load, in one response. Parts that fail
+// are reported under errors so the rest of the page can still render
+app.get('/api/bootstrap', authenticateToken, async (req, res) => {
+    try {
+        const [status, databaseStats] = await Promise.allSettled([
+            getCachedClusterStatus(),
+            getCachedDatabaseStats()
+        ]);
+        
+        // Splice in the cached status and stats JSON instead of re-serializing them
+        const errors = {
+            status: status.status === 'rejected' ? status.reason.message : null,
+            databaseStats: databaseStats.status === 'rejected' ? databaseStats.reason.message : null
+        };
+        res.type('application/json').send(
+            `{"config":${configJson}` +
+            `,"status":${status.status === 'fulfilled' ? cachedJson(statusCache, status.value) : 'null'}` +
+            `,"databaseStats":${databaseStats.status === 'fulfilled' ? cachedJson(dbStatsCache, databaseStats.value) : 'null'}` +
+            `,"errors":${JSON.stringify(errors)}}`
+        );
+    } catch (error) {
+        logger.error('Failed to get bootstrap data:', error);
+        res.status(500).json({ error: 'Failed to get bootstrap data' });
+    }
+});
+
 // Node details
 app.get('/api/nodes/:nodeId', authenticateToken, async (req, res) => {
     try {
@@ -214,23 +457,88 @@ app.get('/api/nodes/:nodeId', authenticateToken, async (req, res) => {
 // Database statistics
 app.get('/api/database/stats', authenticateToken, async (req, res) => {
     try {
-        const stats = await getDatabaseStats();
-        res.json(stats);
+        const stats = await getCachedDatabaseStats();
+        res.type('application/json').send(cachedJson(dbStatsCache, stats));
     } catch (error) {
         logger.error('Failed to get database stats:', error);
         res.status(500).json({ error: 'Failed to get database stats' });
     }
 });
 
-// Run query
+// Resolve once a backpressured response drains or the client goes away; a
+// response destroyed mid-write never emits 'drain', so waiting on that alone
+// would hang the handler
+function drainOrClose(res) {
+    if (res.destroyed) {
+        return Promise.resolve();
+    }
+    return new Promise(resolve => {
+        const done = () => {
+            res.off('drain', done);
+            res.off('close', done);
+            resolve();
+        };
+        res.on('drain', done);
+        res.on('close', done);
+    });
+}
+
+// Run query; results stream back as NDJSON, one {"document": ...} line per
+// document followed by a single {"summary": ...} line
 app.post('/api/database/query', authenticateToken, async (req, res) => {
+    const startTime = Date.now();
+    let count = 0;
+    let hasMore = false;
+    let documents = null;
+    
+    res.type('application/x-ndjson');
     try {
-        const { query, collection, nodeId } = req.body;
-        const result = await runQuery(query, collection, nodeId);
-        res.json(result);
+        const { query, collection, nodeId, operation, projection, page = 0 } = req.body;
+        documents = openQuery(query, collection, nodeId, operation, projection, page);
+        
+        for await (const document of documents) {
+            if (res.destroyed) {
+                break;
+            }
+            // The look-ahead document only signals that another page exists
+            if (count === QUERY_RESULT_LIMIT) {
+                hasMore = true;
+                break;
+            }
+            count++;
+            // Relaxed Extended JSON keeps ObjectIds and dates in a form that can
+            // be pasted back into a query
+            if (!res.write(BSON.EJSON.stringify({ document }, { relaxed: true }) + '\n')) {
+                await drainOrClose(res);
+            }
+        }
+        
+        res.end(JSON.stringify({
+            summary: {
+                success: true,
+                executionTime: Date.now() - startTime,
+                count,
+                page,
+                hasMore,
+                timestamp: new Date()
+            }
+        }) + '\n');
     } catch (error) {
-        logger.error('Failed to run query:', error);
-        res.status(500).json({ error: 'Failed to run query', details: error.message });
+        // Headers may already be out, so failures are reported in-band
+        logger.error('Error running query:', error);
+        res.end(JSON.stringify({
+            summary: {
+                success: false,
+                error: error.message,
+                count,
+                timestamp: new Date()
+            }
+        }) + '\n');
+    } finally {
+        // Release the server-side cursor however the loop ended
+        if (documents && typeof documents.close === 'function') {
+            documents.close().catch(error => logger.warn(`Failed to close query cursor: ${error.message}`));
+        }
     }
 });
 
@@ -239,6 +547,13 @@ app.post('/api/nodes/:nodeId/ssh', authenticateToken, async (req, res) => {
     try {
         const nodeId = req.params.nodeId;
         const { command } = req.body;
+        
+        // Clients that accept NDJSON get output as it is produced, one
+        // {"stdout": ...} or {"stderr": ...} line per chunk, then a summary line
+        if (req.accepts(['json', 'application/x-ndjson']) === 'application/x-ndjson') {
+            return streamSSHCommand(req, res, nodeId, command);
+        }
+        
         const result = await executeSSHCommand(nodeId, command);
         res.json(result);
     } catch (error) {
@@ -247,10 +562,39 @@ app.post('/api/nodes/:nodeId/ssh', authenticateToken, async (req, res) => {
     }
 });
 
+async function streamSSHCommand(req, res, nodeId, command) {
+    res.type('application/x-ndjson');
+    try {
+        const result = await executeSSHCommand(nodeId, command, (kind, text) => {
+            if (res.destroyed) {
+                return null;
+            }
+            return res.write(JSON.stringify({ [kind]: text }) + '\n') ? null : drainOrClose(res);
+        });
+        res.end(JSON.stringify({
+            summary: {
+                success: result.success,
+                exitCode: result.exitCode,
+                timestamp: result.timestamp
+            }
+        }) + '\n');
+    } catch (error) {
+        // Headers may already be out, so failures are reported in-band
+        logger.error(`SSH command failed for node ${nodeId}:`, error);
+        res.end(JSON.stringify({
+            summary: {
+                success: false,
+                error: error.message,
+                timestamp: new Date()
+            }
+        }) + '\n');
+    }
+}
+
 // Configuration management
 app.get('/api/config', authenticateToken, async (req, res) => {
     try {
-        res.json(config);
+        res.type('application/json').send(configJson);
     } catch (error) {
         logger.error('Failed to get configuration:', error);
         res.status(500).json({ error: 'Failed to get configuration' });
@@ -261,11 +605,16 @@ app.post('/api/config', authenticateToken, async (req, res) => {
     try {
         const newConfig = req.body;
         await saveConfig(newConfig);
-        config = newConfig;
+        applyConfig(newConfig);
         res.json({ success: true, message: 'Configuration saved successfully' });
         
-        // Restart connections with new config
-        await setupMongoConnections();
+        // Tell the other open dashboards to reload the configuration
+        const origin = req.get('X-Socket-Id');
+        (origin ? io.except(origin) : io).emit('config_changed');
+        
+        // Restart connections with the new config in the background; the
+        // response is already out and does not wait on the reconnect
+        reconnectAll();
     } catch (error) {
         logger.error('Failed to save configuration:', error);
         res.status(500).json({ error: 'Failed to save configuration', details: error.message });
@@ -283,6 +632,26 @@ app.get('/api/replication/lag', authenticateToken, async (req, res) => {
     }
 });
 
+// Replication lag as server-sent events, for consumers that only need the lag
+// series or sit behind proxies without websocket support. Each monitoring tick
+// writes one event to every open stream. The dashboard itself stays on the
+// monitoring socket: its frames already carry the lag alongside the node status
+// it needs, so a second connection would only repeat each tick
+app.get('/api/replication/lag/stream', authenticateStreamToken, (req, res) => {
+    res.writeHead(200, {
+        'Content-Type': 'text/event-stream',
+        // no-transform keeps the compression middleware from buffering events
+        'Cache-Control': 'no-cache, no-transform',
+        'Connection': 'keep-alive'
+    });
+    res.write('retry: 5000\n\n');
+    
+    lagStreamClients.add(res);
+    req.on('close', () => {
+        lagStreamClients.delete(res);
+    });
+});
+
 // Performance metrics
 app.get('/api/metrics/performance', authenticateToken, async (req, res) => {
     try {
@@ -294,11 +663,6 @@ app.get('/api/metrics/performance', authenticateToken, async (req, res) => {
     }
 });
 
-// Serve main dashboard
-app.get('/', (req, res) => {
-    res.sendFile(path.join(__dirname, 'public', 'index.html'));
-});
-
 // Helper functions
 
 async function getClusterStatus() {
@@ -306,51 +670,16 @@ async function getClusterStatus() {
         const client = mongoClients.replicaSet;
         const admin = client.db('admin');
         
-        // Get replica set status
-        const rsStatus = await admin.command({ replSetGetStatus: 1 });
-        
-        // Get server status for each node
-        const nodeStatuses = [];
-        
-        for (const node of config.mongodb_cluster.nodes) {
-            try {
-                const nodeClient = mongoClients[`node_${node.id}`];
-                if (nodeClient) {
-                    const nodeAdmin = nodeClient.db('admin');
-                    const serverStatus = await nodeAdmin.command({ serverStatus: 1 });
-                    const dbStats = await nodeClient.db(config.hr_database.name).stats();
-                    
-                    nodeStatuses.push({
-                        id: node.id,
-                        hostname: node.hostname,
-                        ip: node.ip,
-                        port: node.port,
-                        role: node.role,
-                        status: 'online',
-                        serverStatus,
-                        dbStats,
-                        uptime: serverStatus.uptime,
-                        connections: serverStatus.connections,
-                        memory: serverStatus.mem,
-                        opcounters: serverStatus.opcounters
-                    });
-                }
-            } catch (error) {
-                nodeStatuses.push({
-                    id: node.id,
-                    hostname: node.hostname,
-                    ip: node.ip,
-                    port: node.port,
-                    role: node.role,
-                    status: 'offline',
-                    error: error.message
-                });
-            }
-        }
+        // Replica set status and every node's server status are independent,
+        // so issue them concurrently instead of waiting on each node in turn
+        const [rsStatus, nodeStatuses] = await Promise.all([
+            admin.command({ replSetGetStatus: 1 }),
+            Promise.all(config.mongodb_cluster.nodes.map(getNodeStatus))
+        ]);
         
         return {
             replicaSet: rsStatus,
-            nodes: nodeStatuses,
+            nodes: nodeStatuses.filter(Boolean),
             timestamp: new Date()
         };
     } catch (error) {
@@ -359,9 +688,119 @@ async function getClusterStatus() {
     }
 }
 
+// Per-node dbStats walks collection metadata, so it is refreshed on its own
+// slower clock; status ticks in between reuse the last result
+const NODE_DB_STATS_TTL_MS = 60000;
+const nodeDbStatsCache = new Map();
+
+async function getNodeDbStats(node, nodeClient) {
+    const cached = nodeDbStatsCache.get(node.id);
+    if (cached && Date.now() - cached.timestamp < NODE_DB_STATS_TTL_MS) {
+        return cached.stats;
+    }
+    
+    const dbStats = await nodeClient.db(config.hr_database.name).stats();
+    // Only the figures the dashboard renders
+    const stats = {
+        collections: dbStats.collections,
+        objects: dbStats.objects,
+        dataSize: dbStats.dataSize,
+        storageSize: dbStats.storageSize,
+        indexes: dbStats.indexes,
+        indexSize: dbStats.indexSize
+    };
+    nodeDbStatsCache.set(node.id, { timestamp: Date.now(), stats });
+    return stats;
+}
+
+async function getNodeStatus(node) {
+    const nodeClient = mongoClients[`node_${node.id}`];
+    if (!nodeClient) {
+        return null;
+    }
+    
+    try {
+        const [serverStatus, dbStats] = await Promise.all([
+            nodeClient.db('admin').command(SERVER_STATUS_SUMMARY),
+            getNodeDbStats(node, nodeClient)
+        ]);
+        
+        return {
+            id: node.id,
+            hostname: node.hostname,
+            ip: node.ip,
+            port: node.port,
+            role: node.role,
+            status: 'online',
+            // Only the fields the dashboard renders; the full serverStatus
+            // document is tens of KB per node and is served by /api/nodes/:id.
+            // This object is re-sent (as deltas) on every monitoring tick
+            dbStats,
+            uptime: serverStatus.uptime,
+            connections: {
+                current: serverStatus.connections.current,
+                available: serverStatus.connections.available
+            },
+            memory: {
+                resident: serverStatus.mem.resident,
+                virtual: serverStatus.mem.virtual
+            },
+            opcounters: {
+                insert: serverStatus.opcounters.insert,
+                query: serverStatus.opcounters.query,
+                update: serverStatus.opcounters.update,
+                delete: serverStatus.opcounters.delete,
+                getmore: serverStatus.opcounters.getmore,
+                command: serverStatus.opcounters.command
+            }
+        };
+    } catch (error) {
+        return {
+            id: node.id,
+            hostname: node.hostname,
+            ip: node.ip,
+            port: node.port,
+            role: node.role,
+            status: 'offline',
+            error: error.message
+        };
+    }
+}
+
+async function getCachedClusterStatus() {
+    if (statusCache.payload && Date.now() - statusCache.timestamp < STATUS_CACHE_TTL_MS) {
+        return statusCache.payload;
+    }
+    
+    if (!statusCache.pending) {
+        statusCache.pending = getClusterStatus()
+            .then(payload => {
+                statusCache.timestamp = Date.now();
+                statusCache.payload = payload;
+                statusCache.body = JSON.stringify(payload);
+                return payload;
+            })
+            .catch(error => {
+                // During an election or network blip, fall back to the last good status
+                // instead of failing every client until the primary is reachable again
+                const transient = error instanceof MongoServerSelectionError || error instanceof MongoNetworkError;
+                if (transient && statusCache.payload && Date.now() - statusCache.timestamp < STATUS_STALE_MAX_MS) {
+                    logger.warn(`Serving stale cluster status: ${error.message}`);
+                    return { ...statusCache.payload, stale: true };
+                }
+                throw error;
+            })
+            .finally(() => {
+                statusCache.pending = null;
+            });
+    }
+    
+    return statusCache.pending;
+}
+
 async function getNodeDetails(nodeId) {
     try {
-        const node = config.mongodb_cluster.nodes.find(n => n.id.toString() === nodeId);
+        const node = nodesById.get(nodeId);
         if (!node) {
             throw new Error('Node not found');
         }
@@ -375,27 +814,28 @@ async function getNodeDetails(nodeId) {
         const db = client.db(config.hr_database.name);
         
         // Get detailed node information
-        const serverStatus = await admin.command({ serverStatus: 1 });
-        const dbStats = await db.stats();
-        const collections = await db.listCollections().toArray();
+        const [serverStatus, dbStats, collections] = await Promise.all([
+            admin.command({ serverStatus: 1 }),
+            db.stats(),
+            db.listCollections().toArray()
+        ]);
         
-        // Get collection stats
-        const collectionStats = [];
-        for (const collection of collections) {
+        // Get collection stats concurrently, skipping collections that can't be accessed
+        const collectionStats = (await Promise.all(collections.map(async (collection) => {
             try {
                 const stats = await db.collection(collection.name).stats();
-                collectionStats.push({
+                return {
                     name: collection.name,
                     count: stats.count,
                     size: stats.size,
                     avgObjSize: stats.avgObjSize,
                     storageSize: stats.storageSize,
                     indexes: stats.nindexes
-                });
+                };
             } catch (error) {
-                // Skip collections that can't be accessed
+                return null;
             }
-        }
+        }))).filter(Boolean);
         
         return {
             node,
@@ -413,21 +853,24 @@ async function getNodeDetails(nodeId) {
 async function getDatabaseStats() {
     try {
         const client = mongoClients.replicaSet;
-        const db = client.db(config.hr_database.name);
+        // Stats and approximate counts tolerate secondary reads, which keeps
+        // this periodic monitoring work off the primary
+        const db = client.db(config.hr_database.name, { readPreference: 'secondaryPreferred' });
         
-        const stats = await db.stats();
-        const collections = await db.listCollections().toArray();
+        const [stats, collections] = await Promise.all([
+            db.stats(),
+            db.listCollections().toArray()
+        ]);
         
-        // Get collection counts
+        // Get collection counts concurrently
         const collectionCounts = {};
-        for (const collection of collections) {
+        await Promise.all(collections.map(async (collection) => {
             try {
-                const count = await db.collection(collection.name).estimatedDocumentCount();
-                collectionCounts[collection.name] = count;
+                collectionCounts[collection.name] = await db.collection(collection.name).estimatedDocumentCount();
             } catch (error) {
                 collectionCounts[collection.name] = 0;
             }
-        }
+        }));
         
         return {
             dbStats: stats,
@@ -440,71 +883,302 @@ async function getDatabaseStats() {
     }
 }
 
-async function runQuery(queryString, collectionName, nodeId) {
-    try {
-        let client;
-        if (nodeId && nodeId !== 'replica_set') {
-            client = mongoClients[`node_${nodeId}`];
-        } else {
-            client = mongoClients.replicaSet;
+async function getCachedDatabaseStats() {
+    if (dbStatsCache.payload && Date.now() - dbStatsCache.timestamp < DB_STATS_CACHE_TTL_MS) {
+        return dbStatsCache.payload;
+    }
+    
+    if (!dbStatsCache.pending) {
+        dbStatsCache.pending = getDatabaseStats()
+            .then(payload => {
+                dbStatsCache.timestamp = Date.now();
+                dbStatsCache.payload = payload;
+                dbStatsCache.body = JSON.stringify(payload);
+                return payload;
+            })
+            .finally(() => {
+                dbStatsCache.pending = null;
+            });
+    }
+    return dbStatsCache.pending;
+}
+
+function findForbiddenOperator(value) {
+    if (Array.isArray(value)) {
+        for (const item of value) {
+            const found = findForbiddenOperator(item);
+            if (found) return found;
         }
-        
-        if (!client) {
-            throw new Error('Client not available');
+    } else if (value && typeof value === 'object') {
+        for (const [key, nested] of Object.entries(value)) {
+            if (FORBIDDEN_QUERY_OPERATORS.has(key)) return key;
+            const found = findForbiddenOperator(nested);
+            if (found) return found;
         }
-        
-        const db = client.db(config.hr_database.name);
-        const collection = db.collection(collectionName);
-        
-        // Parse and execute query
-        const query = JSON.parse(queryString);
-        const startTime = Date.now();
-        
-        let result;
-        if (Array.isArray(query)) {
-            // Aggregation pipeline
-            result = await collection.aggregate(query).limit(100).toArray();
-        } else {
-            // Find query
-            result = await collection.find(query).limit(100).toArray();
+    }
+    return null;
+}
+
+// Console JSON is Extended JSON, so {"$oid": ...} and {"$date": ...} become
+// ObjectIds and Dates. Operators are checked on the plain parsed value first
+function toBsonValue(value) {
+    return BSON.EJSON.deserialize(value, { relaxed: true });
+}
+
+// Parse console JSON and find any forbidden operator in it. Users re-run the
+// same text against different nodes, so the verdict of the recursive scan is
+// remembered per text. The parsed value itself is not cached: the driver may
+// modify what it is given (a cursor limit appends to the pipeline array), so
+// every request gets a fresh object from the native parser
+function parseConsoleJson(text) {
+    const value = JSON.parse(text);
+    let forbidden = queryCheckCache.get(text);
+    if (forbidden === undefined) {
+        forbidden = findForbiddenOperator(value);
+        if (queryCheckCache.size >= QUERY_CHECK_CACHE_SIZE) {
+            queryCheckCache.delete(queryCheckCache.keys().next().value);
         }
-        
-        const executionTime = Date.now() - startTime;
-        
-        return {
-            success: true,
-            result,
-            executionTime,
-            count: result.length,
-            timestamp: new Date()
-        };
+    } else {
+        queryCheckCache.delete(text);
+    }
+    // Re-inserting moves the text to the most recently used end
+    queryCheckCache.set(text, forbidden);
+    
+    if (forbidden) {
+        throw new Error(`Operator ${forbidden} is not allowed`);
+    }
+    return toBsonValue(value);
+}
+
+// Query and projection arrive either as JSON text (the dashboard's editor) or,
+// from API clients, as JSON values already decoded with the request body;
+// values are only checked, so they are not parsed a second time
+function readConsoleJson(input) {
+    if (typeof input === 'string') {
+        return parseConsoleJson(input);
+    }
+    const forbidden = findForbiddenOperator(input);
+    if (forbidden) {
+        throw new Error(`Operator ${forbidden} is not allowed`);
+    }
+    return toBsonValue(input);
+}
+
+// Validate a console query and open it against the requested node
+function openQuery(queryInput, collectionName, nodeId, operation, projectionInput, page = 0) {
+    let client;
+    if (nodeId && nodeId !== 'replica_set') {
+        client = mongoClients[`node_${nodeId}`];
+    } else {
+        client = mongoClients.replicaSet;
+    }
+    
+    if (!client) {
+        throw new Error('Client not available');
+    }
+    
+    const db = client.db(config.hr_database.name);
+    const collection = db.collection(collectionName);
+    
+    // Parse and validate query
+    const query = readConsoleJson(queryInput);
+    
+    // Without an explicit operation, arrays are pipelines and objects are find filters
+    const operationName = operation || (Array.isArray(query) ? 'aggregate' : 'find');
+    if (!Object.prototype.hasOwnProperty.call(QUERY_OPERATIONS, operationName)) {
+        throw new Error(`Operation ${operationName} is not supported`);
+    }
+    if ((operationName === 'aggregate') !== Array.isArray(query)) {
+        throw new Error(operationName === 'aggregate'
+            ? 'Aggregation requires a pipeline array'
+            : `${operationName} requires a filter object`);
+    }
+    
+    // An optional find projection trims documents on the server before they
+    // are sent, rather than shipping whole documents to the console
+    let projection;
+    const hasProjection = typeof projectionInput === 'string'
+        ? projectionInput.trim() !== ''
+        : projectionInput !== undefined && projectionInput !== null;
+    if (hasProjection) {
+        if (operationName !== 'find') {
+            throw new Error('Projection is only supported for find');
+        }
+        projection = readConsoleJson(projectionInput);
+        if (projection === null || typeof projection !== 'object' || Array.isArray(projection)) {
+            throw new Error('Projection must be an object');
+        }
+    }
+    
+    if (!Number.isInteger(page) || page < 0 || page > QUERY_MAX_PAGE) {
+        throw new Error(`Page must be an integer from 0 to ${QUERY_MAX_PAGE}`);
+    }
+    
+    return QUERY_OPERATIONS[operationName](collection, query, {
+        projection,
+        skip: page * QUERY_RESULT_LIMIT
+    });
+}
+
+function getSSHConnection(node) {
+    const cached = sshPool.get(node.id);
+    if (cached && Date.now() - cached.lastUsed < SSH_IDLE_TIMEOUT_MS) {
+        cached.lastUsed = Date.now();
+        return cached.ready;
+    }
+    if (cached) {
+        closeSSHConnection(node.id);
+    }
+    
+    const conn = new Client();
+    const entry = { conn, lastUsed: Date.now(), ready: null };
+    const forget = () => {
+        if (sshPool.get(node.id) === entry) {
+            sshPool.delete(node.id);
+        }
+    };
+    
+    entry.ready = new Promise((resolve, reject) => {
+        conn.on('ready', () => {
+            resolve(conn);
+        }).on('error', (error) => {
+            forget();
+            reject(error);
+        }).on('close', forget).connect({
+            host: node.ip,
+            port: 22,
+            username: node.ssh_user,
+            password: node.ssh_password,
+            keepaliveInterval: 15000,
+            // Give up on a stalled handshake well before the command timeout;
+            // concurrent commands for the node share this one attempt
+            readyTimeout: 10000,
+            // privateKey: node.ssh_key_path ? require('fs').readFileSync(node.ssh_key_path) : undefined
+        });
+    });
+    
+    sshPool.set(node.id, entry);
+    return entry.ready;
+}
+
+// With conn, only closes the pooled connection if it is still that one, so a
+// late failure on a replaced connection cannot tear down its successor
+function closeSSHConnection(nodeId, conn = null) {
+    const entry = sshPool.get(nodeId);
+    if (entry && (!conn || entry.conn === conn)) {
+        sshPool.delete(nodeId);
+        entry.conn.end();
+    }
+}
+
+function closeAllSSHConnections() {
+    for (const nodeId of [...sshPool.keys()]) {
+        closeSSHConnection(nodeId);
+    }
+}
+
+function acquireSSHChannel(nodeId) {
+    let slots = sshChannelSlots.get(nodeId);
+    if (!slots) {
+        // Waiters in a Set: iteration follows insertion order, so it dequeues
+        // FIFO in constant time where Array.shift() re-indexes the whole queue
+        slots = { active: 0, waiting: new Set() };
+        sshChannelSlots.set(nodeId, slots);
+    }
+    
+    if (slots.active < SSH_MAX_CHANNELS_PER_NODE) {
+        slots.active++;
+        return Promise.resolve();
+    }
+    return new Promise(resolve => slots.waiting.add(resolve));
+}
+
+function releaseSSHChannel(nodeId) {
+    const slots = sshChannelSlots.get(nodeId);
+    const next = slots.waiting.values().next().value;
+    if (next) {
+        slots.waiting.delete(next);
+        // Hand the slot straight to the next waiting command
+        next();
+    } else {
+        slots.active--;
+    }
+}
+
+// With onOutput, output is handed over as it arrives instead of being collected
+// into the result; see execOnConnection
+async function executeSSHCommand(nodeId, command, onOutput = null) {
+    const node = nodesById.get(nodeId);
+    if (!node) {
+        throw new Error('Node not found');
+    }
+    
+    await acquireSSHChannel(node.id);
+    try {
+        return await runSSHCommand(node, command, onOutput);
+    } finally {
+        releaseSSHChannel(node.id);
+    }
+}
+
+async function runSSHCommand(node, command, onOutput) {
+    const reused = sshPool.has(node.id);
+    const conn = await getSSHConnection(node);
+    
+    try {
+        return await execOnConnection(node, conn, command, onOutput);
     } catch (error) {
-        logger.error('Error running query:', error);
-        return {
-            success: false,
-            error: error.message,
-            timestamp: new Date()
-        };
+        // A pooled connection may have died silently; retry once on a fresh one
+        if (!reused || !error.channelError) {
+            throw error;
+        }
+        logger.warn(`Reopening stale SSH connection for node ${node.id}: ${error.message}`);
+        closeSSHConnection(node.id, conn);
+        // Channel errors happen before any output, so nothing was streamed yet
+        return execOnConnection(node, await getSSHConnection(node), command, onOutput);
     }
 }
 
-async function executeSSHCommand(nodeId, command) {
+// onOutput(kind, text) receives 'stdout' and 'stderr' text as it arrives; when it
+// returns a promise, that output stream is paused until the promise settles,
+// which stops the SSH window from opening further while the consumer catches up
+function execOnConnection(node, conn, command, onOutput = null) {
     return new Promise((resolve, reject) => {
-        const node = config.mongodb_cluster.nodes.find(n => n.id.toString() === nodeId);
-        if (!node) {
-            return reject(new Error('Node not found'));
-        }
-        
-        const conn = new Client();
         let output = '';
         let error = '';
+        let channel = null;
         
-        conn.on('ready', () => {
+        // Timeout after 30 seconds. Other commands may be multiplexed on the same
+        // connection, so only this command's channel is closed; keepalives drop
+        // the connection itself if it has stopped responding. If the channel
+        // never opened, the connection is the problem and is dropped
+        const timer = setTimeout(() => {
+            if (channel) {
+                channel.close();
+            } else {
+                closeSSHConnection(node.id, conn);
+            }
+            reject(new Error('SSH command timeout'));
+        }, 30000);
+        
+        try {
             conn.exec(command, (err, stream) => {
-                if (err) return reject(err);
+                channel = stream;
+                if (err) {
+                    // The connection may be live and carrying other commands (the
+                    // server can refuse one channel, e.g. past MaxSessions), so it is
+                    // left to runSSHCommand's stale-connection retry to decide
+                    clearTimeout(timer);
+                    err.channelError = true;
+                    return reject(err);
+                }
                 
                 stream.on('close', (code, signal) => {
-                    conn.end();
+                    clearTimeout(timer);
+                    const entry = sshPool.get(node.id);
+                    if (entry) {
+                        entry.lastUsed = Date.now();
+                    }
                     resolve({
                         success: code === 0,
                         exitCode: code,
@@ -512,32 +1186,64 @@ async function executeSSHCommand(nodeId, command) {
                         error,
                         timestamp: new Date()
                     });
-                }).on('data', (data) => {
-                    output += data.toString();
-                }).stderr.on('data', (data) => {
-                    error += data.toString();
                 });
+                
+                // Decode as UTF-8 across chunk boundaries
+                stream.setEncoding('utf8');
+                stream.stderr.setEncoding('utf8');
+                const forward = (source, kind) => (text) => {
+                    const wait = onOutput(kind, text);
+                    if (wait) {
+                        source.pause();
+                        wait.then(() => source.resume(), () => source.resume());
+                    }
+                };
+                if (onOutput) {
+                    stream.on('data', forward(stream, 'stdout'));
+                    stream.stderr.on('data', forward(stream.stderr, 'stderr'));
+                } else {
+                    stream.on('data', (text) => {
+                        output += text;
+                    });
+                    stream.stderr.on('data', (text) => {
+                        error += text;
+                    });
+                }
             });
-        }).connect({
-            host: node.ip,
-            port: 22,
-            username: node.ssh_user,
-            password: node.ssh_password,
-            // privateKey: node.ssh_key_path ? require('fs').readFileSync(node.ssh_key_path) : undefined
-        });
-        
-        // Timeout after 30 seconds
-        setTimeout(() => {
-            conn.end();
-            reject(new Error('SSH command timeout'));
-        }, 30000);
+        } catch (err) {
+            // exec throws synchronously when the underlying socket is already gone
+            clearTimeout(timer);
+            closeSSHConnection(node.id, conn);
+            err.channelError = true;
+            reject(err);
+        }
+    });
+}
+
+// Reconnects run one after another, so back-to-back saves cannot interleave
+// closing one set of pools with opening another
+let reconnectChain = Promise.resolve();
+
+function reconnectAll() {
+    reconnectChain = reconnectChain.then(async () => {
+        // Release the old pools before opening new ones
+        closeAllSSHConnections();
+        await closeMongoConnections();
+        await setupMongoConnections();
+    }).catch(error => {
+        logger.error('Failed to reconnect with the new configuration:', error);
     });
+    return reconnectChain;
 }
 
 async function saveConfig(newConfig) {
     try {
+        // Write to a temporary file and rename it over the original so a crash
+        // mid-write never leaves a truncated configuration behind
         const configPath = '../config/accounts.json';
-        await fs.writeFile(configPath, JSON.stringify(newConfig, null, 2));
+        const tempPath = `${configPath}.${process.pid}.tmp`;
+        await fs.writeFile(tempPath, JSON.stringify(newConfig, null, 2));
+        await fs.rename(tempPath, configPath);
         logger.info('Configuration saved successfully');
     } catch (error) {
         logger.error('Failed to save configuration:', error);
@@ -551,46 +1257,72 @@ async function getReplicationLag() {
         const admin = client.db('admin');
         
         const rsStatus = await admin.command({ replSetGetStatus: 1 });
-        const primary = rsStatus.members.find(member => member.state === 1);
-        
-        if (!primary) {
-            throw new Error('No primary found');
-        }
-        
-        const lagInfo = rsStatus.members.map(member => {
-            const lag = primary.optimeDate - member.optimeDate;
-            return {
-                name: member.name,
-                state: member.state,
-                stateStr: member.stateStr,
-                health: member.health,
-                optime: member.optimeDate,
-                lag: Math.max(0, lag),
-                lagSeconds: Math.max(0, lag / 1000)
-            };
-        });
-        
-        return {
-            primary: primary.name,
-            members: lagInfo,
-            timestamp: new Date()
-        };
+        return computeReplicationLag(rsStatus);
     } catch (error) {
         logger.error('Error getting replication lag:', error);
         throw error;
     }
 }
 
+// Millisecond wall time of a member's last applied op; optimeDate only has
+// second resolution, so it is the fallback for servers that predate the field
+function memberAppliedTime(member) {
+    const applied = member.lastAppliedWallTime || member.optimeDate;
+    return applied ? new Date(applied).getTime() : null;
+}
+
+// Derive every member's lag from a single replSetGetStatus document
+function computeReplicationLag(rsStatus, timestamp = new Date()) {
+    const primary = rsStatus.members.find(member => member.state === 1);
+    
+    if (!primary) {
+        throw new Error('No primary found');
+    }
+    
+    const primaryApplied = memberAppliedTime(primary);
+    const lagInfo = rsStatus.members.map(member => {
+        const applied = memberAppliedTime(member);
+        const lag = primaryApplied !== null && applied !== null ? primaryApplied - applied : 0;
+        return {
+            name: member.name,
+            state: member.state,
+            stateStr: member.stateStr,
+            health: member.health,
+            optime: member.optimeDate,
+            lag: Math.max(0, lag),
+            lagSeconds: Math.max(0, lag / 1000)
+        };
+    });
+    
+    return {
+        primary: primary.name,
+        members: lagInfo,
+        timestamp
+    };
+}
+
+// Lag section of the socket frame: member names and whole-millisecond lags as
+// parallel arrays, which MessagePack encodes as compact strings and small
+// integers instead of one map per member with a float lag and Date optime
+function packReplicationLag(lagInfo) {
+    return {
+        primary: lagInfo.primary,
+        names: lagInfo.members.map(member => member.name),
+        lags: lagInfo.members.map(member => Math.round(member.lag))
+    };
+}
+
 async function getPerformanceMetrics() {
     try {
         const metrics = {};
         
-        for (const node of config.mongodb_cluster.nodes) {
+        // Query every node concurrently so one slow node doesn't delay the others
+        await Promise.all(config.mongodb_cluster.nodes.map(async (node) => {
             try {
                 const client = mongoClients[`node_${node.id}`];
                 if (client) {
                     const admin = client.db('admin');
-                    const serverStatus = await admin.command({ serverStatus: 1 });
+                    const serverStatus = await admin.command(SERVER_STATUS_SUMMARY);
                     
                     metrics[`node_${node.id}`] = {
                         hostname: node.hostname,
@@ -609,7 +1341,7 @@ async function getPerformanceMetrics() {
                     timestamp: new Date()
                 };
             }
-        }
+        }));
         
         return metrics;
     } catch (error) {
@@ -625,6 +1357,21 @@ io.on('connection', (socket) => {
     socket.on('subscribe_monitoring', () => {
         logger.info('Client subscribed to monitoring updates');
         socket.join('monitoring');
+        // Give the new subscriber a baseline for the delta frames that follow
+        if (lastMonitoringFrame) {
+            socket.emit('cluster_update', lastMonitoringFrame);
+        }
+    });
+    
+    socket.on('unsubscribe_monitoring', () => {
+        socket.leave('monitoring');
+    });
+    
+    // A client that missed a frame asks for the full state as of the last broadcast
+    socket.on('resync', () => {
+        if (lastMonitoringFrame) {
+            socket.emit('cluster_update', lastMonitoringFrame);
+        }
     });
     
     socket.on('disconnect', () => {
@@ -632,32 +1379,174 @@ io.on('connection', (socket) => {
     });
 });
 
-// Periodic monitoring updates
+// Periodic monitoring updates. Frames are numbered and carry only the node
+// fields that changed since the previous frame; lastMonitoringFrame holds the
+// full state as of that frame for new subscribers and resyncs
+let monitoringSeq = 0;
+let lastMonitoringFrame = null;
+let lastBroadcastNodes = new Map();
+let lastBroadcastDatabaseStats = null;
+
+// Return each node's changed fields (keyed by id), or null when the node set
+// itself changed and only a full frame makes sense
+function diffNodeStatuses(nodes) {
+    const serializedNodes = new Map();
+    const changed = [];
+    let sameNodeSet = nodes.length === lastBroadcastNodes.size;
+    
+    for (const node of nodes) {
+        const previous = lastBroadcastNodes.get(node.id);
+        const serialized = {};
+        const delta = { id: node.id };
+        let dirty = false;
+        
+        if (!previous) {
+            sameNodeSet = false;
+        }
+        for (const [field, value] of Object.entries(node)) {
+            serialized[field] = JSON.stringify(value);
+            if (!previous || serialized[field] !== previous[field]) {
+                delta[field] = value;
+                dirty = true;
+            }
+        }
+        // Fields that disappeared, e.g. counters of a node that went offline
+        for (const field of Object.keys(previous || {})) {
+            if (!(field in serialized)) {
+                delta[field] = null;
+                dirty = true;
+            }
+        }
+        
+        serializedNodes.set(node.id, serialized);
+        if (dirty) {
+            changed.push(delta);
+        }
+    }
+    
+    lastBroadcastNodes = serializedNodes;
+    return sameNodeSet ? changed : null;
+}
+
+// The replSetGetStatus fields the dashboard renders. Lag is already computed
+// into the same frame, so the rest of each member document (heartbeats, sync
+// source, election details) is dropped instead of re-sent on every tick
+function summarizeReplicaSet(rsStatus) {
+    return {
+        set: rsStatus.set,
+        members: rsStatus.members.map(member => ({
+            name: member.name,
+            state: member.state,
+            stateStr: member.stateStr,
+            health: member.health,
+            optimeDate: member.optimeDate,
+            lastAppliedWallTime: member.lastAppliedWallTime
+        }))
+    };
+}
+
 async function sendMonitoringUpdates() {
     try {
-        const status = await getClusterStatus();
-        const lagInfo = await getReplicationLag();
-        const metrics = await getPerformanceMetrics();
+        // One status refresh feeds the lag view and node deltas instead of
+        // re-running replSetGetStatus and serverStatus for each of them. The
+        // database stats refresh is independent, so both run concurrently and
+        // the tick waits for the slower one rather than their sum
+        const [statusResult, statsResult] = await Promise.allSettled([
+            getCachedClusterStatus(),
+            getCachedDatabaseStats()
+        ]);
+        if (statusResult.status === 'rejected') {
+            throw statusResult.reason;
+        }
+        const status = statusResult.value;
+        // One timestamp stamps every section of the frame
+        const tick = new Date();
+        const lagInfo = computeReplicationLag(status.replicaSet, tick);
         
-        io.to('monitoring').emit('cluster_update', {
-            status,
-            replicationLag: lagInfo,
-            metrics,
-            timestamp: new Date()
-        });
+        // Database stats ride along in the same frame so clients need no REST polling,
+        // but only on ticks where the cached stats were refreshed since the last frame
+        let databaseStats = null;
+        try {
+            if (statsResult.status === 'rejected') {
+                throw statsResult.reason;
+            }
+            const latestStats = statsResult.value;
+            if (latestStats !== lastBroadcastDatabaseStats) {
+                databaseStats = latestStats;
+                lastBroadcastDatabaseStats = latestStats;
+            }
+        } catch (error) {
+            logger.warn(`Omitting database stats from monitoring update: ${error.message}`);
+        }
+        
+        const changedNodes = diffNodeStatuses(status.nodes);
+        const replicaSet = summarizeReplicaSet(status.replicaSet);
+        const frame = {
+            seq: ++monitoringSeq,
+            full: changedNodes === null,
+            status: { ...status, replicaSet, nodes: changedNodes === null ? status.nodes : changedNodes },
+            replicationLag: packReplicationLag(lagInfo),
+            databaseStats,
+            // Epoch milliseconds pack as a plain integer rather than a Date extension
+            timestamp: tick.getTime()
+        };
+        lastMonitoringFrame = {
+            ...frame,
+            full: true,
+            status: { ...status, replicaSet },
+            databaseStats: lastBroadcastDatabaseStats
+        };
+        
+        // Volatile: a client that has not drained the previous tick skips this one
+        // instead of queueing its own copy; the sequence gap makes it resync
+        io.to('monitoring').volatile.emit('cluster_update', frame);
+        
+        if (lagStreamClients.size > 0) {
+            const event = `data: ${JSON.stringify(lagInfo)}\n\n`;
+            for (const client of lagStreamClients) {
+                // Like the volatile socket emit: a consumer that has not drained
+                // the last event skips this one instead of buffering it in memory
+                if (!client.writableNeedDrain) {
+                    client.write(event);
+                }
+            }
+        }
     } catch (error) {
         logger.error('Error sending monitoring updates:', error);
     }
 }
 
-// Schedule monitoring updates every 5 seconds
-cron.schedule('*/5 * * * * *', sendMonitoringUpdates);
+// Run monitoring updates every 5 seconds, scheduling the next tick only after the
+// current one finishes and skipping the MongoDB work while nobody is subscribed.
+// Each frame coalesces every status change since the previous tick, so the
+// interval is the coalescing window; MONITORING_INTERVAL_MS overrides it
+const MONITORING_INTERVAL_MS = parseInt(process.env.MONITORING_INTERVAL_MS, 10) || 5000;
+
+async function monitoringLoop() {
+    const subscribers = io.sockets.adapter.rooms.get('monitoring');
+    if ((subscribers && subscribers.size > 0) || lagStreamClients.size > 0) {
+        await sendMonitoringUpdates();
+    }
+    setTimeout(monitoringLoop, MONITORING_INTERVAL_MS);
+}
+
+// Close SSH connections that have been idle past the reuse window
+setInterval(() => {
+    const now = Date.now();
+    for (const [nodeId, entry] of sshPool) {
+        if (now - entry.lastUsed >= SSH_IDLE_TIMEOUT_MS) {
+            closeSSHConnection(nodeId);
+        }
+    }
+}, 30000).unref();
 
 // Startup
 async function startServer() {
     try {
         await loadConfig();
+        await renderIndexHtml();
         await setupMongoConnections();
+        monitoringLoop();
         
         const PORT = process.env.PORT || 3000;
         server.listen(PORT, '0.0.0.0', () => {
@@ -673,41 +1562,27 @@ async function startServer() {
 }
 
 // Graceful shutdown
-process.on('SIGTERM', async () => {
-    logger.info('Received SIGTERM, shutting down gracefully');
+async function shutdown(signal) {
+    logger.info(`Received ${signal}, shutting down gracefully`);
     
-    // Close MongoDB connections
-    for (const client of Object.values(mongoClients)) {
-        try {
-            await client.close();
-        } catch (error) {
-            logger.error('Error closing MongoDB connection:', error);
-        }
-    }
-    
-    server.close(() => {
-        logger.info('Server closed');
-        process.exit(0);
-    });
-});
-
-process.on('SIGINT', async () => {
-    logger.info('Received SIGINT, shutting down gracefully');
+    closeAllSSHConnections();
     
-    // Close MongoDB connections
-    for (const client of Object.values(mongoClients)) {
-        try {
-            await client.close();
-        } catch (error) {
-            logger.error('Error closing MongoDB connection:', error);
-        }
+    // End open event streams so server.close() is not held up by them
+    for (const client of lagStreamClients) {
+        client.end();
     }
     
+    // Close the pooled MongoDB clients concurrently
+    await closeMongoConnections();
+    
     server.close(() => {
         logger.info('Server closed');
         process.exit(0);
     });
-});
+}
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
 
 // Start the server
 startServer();
\ No newline at end of file
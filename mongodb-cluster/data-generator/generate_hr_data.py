@@ -10,12 +10,15 @@ import sys
 import json
 import random
 import logging
+import zlib
+import multiprocessing
 from datetime import datetime, timedelta, date
 from pathlib import Path
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pymongo
+from bson import ObjectId
 from faker import Faker
 from PIL import Image, ImageDraw, ImageFont
 from reportlab.pdfgen import canvas
@@ -42,13 +45,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters stripped from company names when building email domains
+EMAIL_DOMAIN_STRIP = str.maketrans('', '', ' ,.')
+
 class HRDataGenerator:
     def __init__(self, config_file='../config/accounts.json'):
         self.fake = Faker(['id_ID', 'en_US'])  # Indonesian and English locales
         self.config_file = config_file
         self.config = self.load_config()
+        self.client = None
         self.db = None
         self.companies = []
+        self.active_employees = []
+        self.batch_size = 10000  # Records per insert_many when batching across employees
+        self.image_templates = {}  # Reusable PIL images keyed by (width, height)
         self.departments = [
             'Human Resources', 'Finance', 'IT', 'Marketing', 'Sales', 
             'Operations', 'Legal', 'Customer Service', 'Research & Development',
@@ -108,8 +118,10 @@ class HRDataGenerator:
             
             logger.info(f"Connecting to MongoDB: {connection_string.split('@')[0]}@***")
             
-            client = pymongo.MongoClient(connection_string)
-            self.db = client[self.config['hr_database']['name']]
+            # Synthetic load only: acknowledge on the primary without waiting for
+            # majority replication or the journal, and skip retryable-write bookkeeping
+            self.client = pymongo.MongoClient(connection_string, retryWrites=False, w=1, journal=False)
+            self.db = self.client[self.config['hr_database']['name']]
             
             # Test connection
             self.db.admin.command('ping')
@@ -117,7 +129,7 @@ class HRDataGenerator:
             
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
-            sys.exit(1)
+            raise
 
     def create_indexes(self):
         """Create database indexes for better performance"""
@@ -164,9 +176,12 @@ class HRDataGenerator:
         if not filename:
             filename = f"dummy_image_{random.randint(1000, 9999)}.png"
         
-        # Create image with random background color
+        # Reuse one pixel buffer per size and repaint it with a random background color
         bg_color = (random.randint(50, 200), random.randint(50, 200), random.randint(50, 200))
-        image = Image.new('RGB', (width, height), bg_color)
+        image = self.image_templates.get((width, height))
+        if image is None:
+            image = self.image_templates[(width, height)] = Image.new('RGB', (width, height))
+        image.paste(bg_color, (0, 0, width, height))
         draw = ImageDraw.Draw(image)
         
         # Add some random shapes
@@ -257,6 +272,7 @@ class HRDataGenerator:
         companies = []
         for i in tqdm(range(count), desc="Generating companies"):
             company = {
+                '_id': ObjectId(),
                 'company_id': f"COMP_{i+1:04d}",
                 'name': self.fake.company(),
                 'industry': random.choice([
@@ -290,153 +306,195 @@ class HRDataGenerator:
         except Exception as e:
             logger.error(f"Failed to insert companies: {e}")
 
-    def generate_employees(self, employees_per_company=1000):
-        """Generate dummy employees for each company"""
-        logger.info(f"Generating {employees_per_company} employees per company...")
-        
-        total_employees = len(self.companies) * employees_per_company
-        
-        with tqdm(total=total_employees, desc="Generating employees") as pbar:
-            for company in self.companies:
-                employees = []
+    def generate_employees(self, employees_per_company=1000, workers=None, seed=None):
+        """Generate dummy employees for each company using a pool of worker processes"""
+        workers = workers or os.cpu_count() or 1
+        logger.info(f"Generating {employees_per_company} employees per company with {workers} workers...")
+        
+        opts = {'employees_per_company': employees_per_company, 'seed': seed}
+        tasks = [(company, opts) for company in self.companies]
+        
+        # MongoClient is not fork-safe, so workers are spawned and open their own connection
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(workers, initializer=init_worker, initargs=(self.config_file,)) as pool:
+            completed = 0
+            for company_name, active, error in tqdm(pool.imap_unordered(process_company, tasks),
+                                                    total=len(tasks), desc="Generating employees",
+                                                    mininterval=1.0, smoothing=0):
+                completed += 1
+                if error:
+                    logger.error(f"Failed to insert employees for {company_name}: {error}")
+                else:
+                    self.active_employees.extend(active)
                 
-                for i in range(employees_per_company):
-                    department = random.choice(self.departments)
-                    position = random.choice(self.positions[department])
-                    
-                    # Generate employee data
-                    first_name = self.fake.first_name()
-                    last_name = self.fake.last_name()
-                    email = f"{first_name.lower()}.{last_name.lower()}@{company['name'].lower().replace(' ', '').replace(',', '').replace('.', '')}.com"
-                    
-                    hire_date = self.fake.date_between(start_date='-5y', end_date='today')
-                    birth_date = self.fake.date_between(start_date='-65y', end_date='-18y')
-                    
-                    # Generate salary based on position and experience
-                    base_salary = random.randint(5000000, 25000000)  # IDR
-                    if 'Manager' in position:
-                        base_salary *= random.uniform(1.5, 3.0)
-                    
-                    # Generate dummy photo
-                    photo_path = self.generate_dummy_image(200, 250, f"employee_{company['company_id']}_{i+1:04d}.jpg")
-                    
-                    employee = {
-                        'employee_id': f"{company['company_id']}_EMP_{i+1:04d}",
-                        'company_id': company['company_id'],
-                        'employee_number': f"E{random.randint(100000, 999999)}",
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'full_name': f"{first_name} {last_name}",
-                        'email': email,
-                        'phone': self.fake.phone_number(),
-                        'birth_date': birth_date,
-                        'gender': random.choice(['Male', 'Female']),
-                        'marital_status': random.choice(['Single', 'Married', 'Divorced', 'Widowed']),
-                        'address': self.fake.address(),
-                        'city': self.fake.city(),
-                        'postal_code': self.fake.postcode(),
-                        'national_id': self.fake.ssn(),
-                        'tax_id': f"NPWP{random.randint(100000000000000, 999999999999999)}",
-                        'department': department,
-                        'position': position,
-                        'hire_date': hire_date,
-                        'employment_status': random.choice(['Active', 'Inactive', 'Terminated']),
-                        'employment_type': random.choice(['Full-time', 'Part-time', 'Contract', 'Intern']),
-                        'manager_id': None,  # Will be set later
-                        'salary': int(base_salary),
-                        'currency': 'IDR',
-                        'bank_account': {
-                            'bank_name': random.choice(['BCA', 'Mandiri', 'BRI', 'BNI', 'CIMB']),
-                            'account_number': str(random.randint(1000000000, 9999999999)),
-                            'account_holder': f"{first_name} {last_name}"
-                        },
-                        'emergency_contact': {
-                            'name': self.fake.name(),
-                            'relationship': random.choice(['Spouse', 'Parent', 'Sibling', 'Friend']),
-                            'phone': self.fake.phone_number()
-                        },
-                        'photo_path': photo_path,
-                        'created_at': datetime.now(),
-                        'updated_at': datetime.now(),
-                        'is_active': True
-                    }
-                    employees.append(employee)
-                    pbar.update(1)
-                
-                # Insert employees for this company
-                try:
-                    result = self.db.employees.insert_many(employees)
-                    logger.info(f"Inserted {len(result.inserted_ids)} employees for {company['name']}")
-                except Exception as e:
-                    logger.error(f"Failed to insert employees for {company['name']}: {e}")
+                # Log progress in blocks rather than once per company
+                if completed % 100 == 0 or completed == len(tasks):
+                    logger.info(f"Inserted employees for {completed}/{len(tasks)} companies")
+
+    def get_active_employees(self):
+        """Return active employees captured at insert time, querying only as a fallback"""
+        if self.active_employees:
+            return self.active_employees
+        return list(self.db.employees.find(
+            {'employment_status': 'Active'},
+            {'_id': 1, 'employee_id': 1, 'company_id': 1, 'full_name': 1, 'salary': 1}
+        ))
+
+    def generate_company_employees(self, company, employees_per_company=1000):
+        """Generate and insert dummy employees for a single company"""
+        employees = []
+        email_domain = f"{company['name'].lower().translate(EMAIL_DOMAIN_STRIP)}.com"
+        
+        for i in range(employees_per_company):
+            department = random.choice(self.departments)
+            position = random.choice(self.positions[department])
+            
+            # Generate employee data
+            first_name = self.fake.first_name()
+            last_name = self.fake.last_name()
+            email = f"{first_name.lower()}.{last_name.lower()}@{email_domain}"
+            
+            hire_date = self.fake.date_between(start_date='-5y', end_date='today')
+            birth_date = self.fake.date_between(start_date='-65y', end_date='-18y')
+            
+            # Generate salary based on position and experience
+            base_salary = random.randint(5000000, 25000000)  # IDR
+            if 'Manager' in position:
+                base_salary *= random.uniform(1.5, 3.0)
+            
+            # Generate dummy photo
+            photo_path = self.generate_dummy_image(200, 250, f"employee_{company['company_id']}_{i+1:04d}.jpg")
+            
+            employee = {
+                '_id': ObjectId(),
+                'employee_id': f"{company['company_id']}_EMP_{i+1:04d}",
+                'company_id': company['company_id'],
+                'employee_number': f"E{random.randint(100000, 999999)}",
+                'first_name': first_name,
+                'last_name': last_name,
+                'full_name': f"{first_name} {last_name}",
+                'email': email,
+                'phone': self.fake.phone_number(),
+                'birth_date': birth_date,
+                'gender': random.choice(['Male', 'Female']),
+                'marital_status': random.choice(['Single', 'Married', 'Divorced', 'Widowed']),
+                'address': self.fake.address(),
+                'city': self.fake.city(),
+                'postal_code': self.fake.postcode(),
+                'national_id': self.fake.ssn(),
+                'tax_id': f"NPWP{random.randint(100000000000000, 999999999999999)}",
+                'department': department,
+                'position': position,
+                'hire_date': hire_date,
+                'employment_status': random.choice(['Active', 'Inactive', 'Terminated']),
+                'employment_type': random.choice(['Full-time', 'Part-time', 'Contract', 'Intern']),
+                'manager_id': None,  # Will be set later
+                'salary': int(base_salary),
+                'currency': 'IDR',
+                'bank_account': {
+                    'bank_name': random.choice(['BCA', 'Mandiri', 'BRI', 'BNI', 'CIMB']),
+                    'account_number': str(random.randint(1000000000, 9999999999)),
+                    'account_holder': f"{first_name} {last_name}"
+                },
+                'emergency_contact': {
+                    'name': self.fake.name(),
+                    'relationship': random.choice(['Spouse', 'Parent', 'Sibling', 'Friend']),
+                    'phone': self.fake.phone_number()
+                },
+                'photo_path': photo_path,
+                'created_at': datetime.now(),
+                'updated_at': datetime.now(),
+                'is_active': True
+            }
+            employees.append(employee)
+        
+        # Unordered so the primary can apply the batch without stopping at the first error.
+        # Generated emails can collide with the unique email index; those documents are
+        # rejected while the rest of the batch is still inserted
+        failed = set()
+        try:
+            self.db.employees.insert_many(employees, ordered=False)
+        except pymongo.errors.BulkWriteError as e:
+            failed = {error['index'] for error in e.details.get('writeErrors', [])}
+            logger.warning(f"Skipped {len(failed)} employees of {company['name']} that failed to insert")
+        
+        # Hand back the fields later phases need so they don't re-query the employees collection
+        return [
+            {field: employee[field] for field in ('_id', 'employee_id', 'company_id', 'full_name', 'salary')}
+            for index, employee in enumerate(employees)
+            if index not in failed and employee['employment_status'] == 'Active'
+        ]
 
     def generate_attendance_data(self, months=12):
         """Generate attendance data for all employees"""
         logger.info(f"Generating attendance data for last {months} months...")
         
         # Get all active employees
-        employees = list(self.db.employees.find({'employment_status': 'Active'}))
-        total_records = len(employees) * months * 22  # Approximate working days per month
+        employees = self.get_active_employees()
+        
+        # Precompute midnight of every working day once instead of per employee
+        today = datetime.combine(date.today(), datetime.min.time())
+        start_day = today - timedelta(days=months * 30)
+        working_days = [
+            day for day in (start_day + timedelta(days=i) for i in range((today - start_day).days + 1))
+            if day.weekday() < 5  # Monday to Friday
+        ]
+        check_in_earliest = 7 * 3600  # 07:00:00
+        check_in_latest = 9 * 3600 + 59 * 60 + 59  # 09:59:59
+        
+        attendance_records = []
+        now = datetime.now()
         
-        with tqdm(total=total_records, desc="Generating attendance") as pbar:
+        with tqdm(total=len(employees), desc="Generating attendance", mininterval=1.0) as pbar:
             for employee in employees:
-                attendance_records = []
+                employee_id = employee['employee_id']
+                company_id = employee['company_id']
                 
-                # Generate attendance for each month
-                start_date = datetime.now() - timedelta(days=months * 30)
-                current_date = start_date
+                for day in working_days:
+                    # 90% attendance rate
+                    if random.random() < 0.9:
+                        check_in_time = day + timedelta(seconds=random.randint(check_in_earliest, check_in_latest))
+                        
+                        # Work duration 7-10 hours
+                        work_hours = random.uniform(7, 10)
+                        check_out_time = check_in_time + timedelta(hours=work_hours)
+                        
+                        # Break time
+                        break_minutes = random.randint(30, 90)
+                        
+                        attendance = {
+                            'employee_id': employee_id,
+                            'company_id': company_id,
+                            'date': day,
+                            'check_in': check_in_time,
+                            'check_out': check_out_time,
+                            'break_minutes': break_minutes,
+                            'work_hours': work_hours,
+                            'overtime_hours': max(0, work_hours - 8),
+                            'status': random.choice(['Present', 'Late', 'Early Leave']) if random.random() < 0.1 else 'Present',
+                            'location': random.choice(['Office', 'Remote', 'Client Site']),
+                            'notes': self.fake.sentence() if random.random() < 0.1 else None,
+                            'created_at': now
+                        }
+                        attendance_records.append(attendance)
                 
-                while current_date <= datetime.now():
-                    # Skip weekends (assuming Monday=0, Sunday=6)
-                    if current_date.weekday() < 5:  # Monday to Friday
-                        # 90% attendance rate
-                        if random.random() < 0.9:
-                            check_in_time = current_date.replace(
-                                hour=random.randint(7, 9),
-                                minute=random.randint(0, 59),
-                                second=random.randint(0, 59)
-                            )
-                            
-                            # Work duration 7-10 hours
-                            work_hours = random.uniform(7, 10)
-                            check_out_time = check_in_time + timedelta(hours=work_hours)
-                            
-                            # Break time
-                            break_minutes = random.randint(30, 90)
-                            
-                            attendance = {
-                                'employee_id': employee['employee_id'],
-                                'company_id': employee['company_id'],
-                                'date': current_date.date(),
-                                'check_in': check_in_time,
-                                'check_out': check_out_time,
-                                'break_minutes': break_minutes,
-                                'work_hours': work_hours,
-                                'overtime_hours': max(0, work_hours - 8),
-                                'status': random.choice(['Present', 'Late', 'Early Leave']) if random.random() < 0.1 else 'Present',
-                                'location': random.choice(['Office', 'Remote', 'Client Site']),
-                                'notes': self.fake.sentence() if random.random() < 0.1 else None,
-                                'created_at': datetime.now()
-                            }
-                            attendance_records.append(attendance)
-                    
-                    current_date += timedelta(days=1)
-                    pbar.update(1)
+                # Insert attendance records across employees in large batches
+                if len(attendance_records) >= self.batch_size:
+                    self.insert_batch(self.db.attendance, attendance_records, 'attendance records')
+                    attendance_records = []
+                    now = datetime.now()
                 
-                # Insert attendance records for this employee
-                if attendance_records:
-                    try:
-                        self.db.attendance.insert_many(attendance_records)
-                    except Exception as e:
-                        logger.error(f"Failed to insert attendance for {employee['employee_id']}: {e}")
+                pbar.update(1)
+        
+        self.insert_batch(self.db.attendance, attendance_records, 'attendance records')
 
     def generate_leave_data(self):
         """Generate leave requests and approvals"""
         logger.info("Generating leave data...")
         
-        employees = list(self.db.employees.find({'employment_status': 'Active'}))
+        employees = self.get_active_employees()
         
-        with tqdm(total=len(employees), desc="Generating leaves") as pbar:
+        with tqdm(total=len(employees), desc="Generating leaves", mininterval=1.0) as pbar:
             for employee in employees:
                 leave_records = []
                 
@@ -493,38 +551,47 @@ class HRDataGenerator:
         """Generate payroll data"""
         logger.info(f"Generating payroll data for last {months} months...")
         
-        employees = list(self.db.employees.find({'employment_status': 'Active'}))
+        employees = self.get_active_employees()
+        
+        # Pay periods are the same for every employee, so derive them once
+        run_date = datetime.now()
+        periods = []
+        for month_offset in range(months):
+            period_date = run_date - timedelta(days=month_offset * 30)
+            period = period_date.strftime('%Y-%m')
+            periods.append((period, period.replace('-', ''), period_date.replace(day=25)))
+        
+        payroll_records = []
+        now = datetime.now()
         
-        with tqdm(total=len(employees) * months, desc="Generating payroll") as pbar:
+        with tqdm(total=len(employees) * months, desc="Generating payroll", mininterval=1.0) as pbar:
             for employee in employees:
-                payroll_records = []
+                employee_id = employee['employee_id']
+                company_id = employee['company_id']
+                base_salary = employee['salary']
+                health_insurance = int(base_salary * 0.02)  # 2% of salary
+                hourly_rate = base_salary / 160  # Assuming 160 work hours per month
                 
-                for month_offset in range(months):
-                    period_date = datetime.now() - timedelta(days=month_offset * 30)
-                    period = period_date.strftime('%Y-%m')
-                    
-                    base_salary = employee['salary']
-                    
+                for period, period_key, pay_date in periods:
                     # Calculate allowances and deductions
                     transport_allowance = random.randint(500000, 1500000)
                     meal_allowance = random.randint(300000, 800000)
-                    health_insurance = int(base_salary * 0.02)  # 2% of salary
                     tax_deduction = int(base_salary * random.uniform(0.05, 0.15))
                     
                     # Get overtime hours from attendance
                     overtime_hours = random.uniform(0, 20)  # Simplified
-                    overtime_pay = int(overtime_hours * (base_salary / 160))  # Assuming 160 work hours per month
+                    overtime_pay = int(overtime_hours * hourly_rate)
                     
                     gross_salary = base_salary + transport_allowance + meal_allowance + overtime_pay
                     total_deductions = health_insurance + tax_deduction
                     net_salary = gross_salary - total_deductions
                     
                     payroll = {
-                        'payroll_id': f"PAY_{employee['employee_id']}_{period.replace('-', '')}",
-                        'employee_id': employee['employee_id'],
-                        'company_id': employee['company_id'],
+                        'payroll_id': f"PAY_{employee_id}_{period_key}",
+                        'employee_id': employee_id,
+                        'company_id': company_id,
                         'period': period,
-                        'pay_date': period_date.replace(day=25),
+                        'pay_date': pay_date,
                         'base_salary': base_salary,
                         'allowances': {
                             'transport': transport_allowance,
@@ -542,34 +609,36 @@ class HRDataGenerator:
                         'payment_method': random.choice(['Bank Transfer', 'Cash', 'Check']),
                         'payment_status': random.choice(['Paid', 'Pending', 'Processing']),
                         'overtime_hours': overtime_hours,
-                        'created_at': datetime.now(),
-                        'updated_at': datetime.now()
+                        'created_at': now,
+                        'updated_at': now
                     }
                     payroll_records.append(payroll)
                 
-                # Insert payroll records
-                if payroll_records:
-                    try:
-                        self.db.payroll.insert_many(payroll_records)
-                    except Exception as e:
-                        logger.error(f"Failed to insert payroll for {employee['employee_id']}: {e}")
+                # Insert payroll records across employees in large batches
+                if len(payroll_records) >= self.batch_size:
+                    self.insert_batch(self.db.payroll, payroll_records, 'payroll records')
+                    payroll_records = []
+                    now = datetime.now()
                 
                 pbar.update(months)
+        
+        self.insert_batch(self.db.payroll, payroll_records, 'payroll records')
 
     def generate_documents(self):
         """Generate document records with dummy files"""
         logger.info("Generating employee documents...")
         
-        employees = list(self.db.employees.find({'employment_status': 'Active'}))
+        employees = self.get_active_employees()
         document_types = [
             'Contract', 'ID Card', 'Resume', 'Certificate', 'Performance Review',
             'Training Record', 'Medical Certificate', 'Tax Document', 'Insurance Form'
         ]
         
-        with tqdm(total=len(employees), desc="Generating documents") as pbar:
+        document_records = []
+        now = datetime.now()
+        
+        with tqdm(total=len(employees), desc="Generating documents", mininterval=1.0) as pbar:
             for employee in employees:
-                document_records = []
-                
                 # Generate 3-7 documents per employee
                 num_docs = random.randint(3, 7)
                 
@@ -606,19 +675,37 @@ class HRDataGenerator:
                         'expiry_date': self.fake.date_between(start_date='today', end_date='+2y') if random.random() < 0.3 else None,
                         'version': 1,
                         'status': 'Active',
-                        'created_at': datetime.now(),
-                        'updated_at': datetime.now()
+                        'created_at': now,
+                        'updated_at': now
                     }
                     document_records.append(document)
                 
-                # Insert document records
-                if document_records:
-                    try:
-                        self.db.documents.insert_many(document_records)
-                    except Exception as e:
-                        logger.error(f"Failed to insert documents for {employee['employee_id']}: {e}")
+                # Insert document records across employees in large batches
+                if len(document_records) >= self.batch_size:
+                    self.insert_batch(self.db.documents, document_records, 'documents')
+                    document_records = []
+                    now = datetime.now()
                 
                 pbar.update(1)
+        
+        self.insert_batch(self.db.documents, document_records, 'documents')
+
+    def insert_batch(self, collection, records, label):
+        """Insert a batch of records unordered so one bad document doesn't stop the rest"""
+        if not records:
+            return
+        try:
+            collection.insert_many(records, ordered=False)
+        except Exception as e:
+            logger.error(f"Failed to insert batch of {len(records)} {label}: {e}")
+
+    def flush_to_disk(self):
+        """Flush writes to disk once at the end since inserts skip the journal"""
+        try:
+            self.client.admin.command('fsync')
+            logger.info("Flushed generated data to disk")
+        except Exception as e:
+            logger.warning(f"Failed to fsync after generation: {e}")
 
     def generate_summary_statistics(self):
         """Generate and display summary statistics"""
@@ -650,13 +737,48 @@ class HRDataGenerator:
         
         return stats
 
+# Per-process generator used by the employee worker pool
+_worker_generator = None
+_worker_init_error = None
+
+def init_worker(config_file):
+    """Initialize a worker process with its own generator and MongoDB connection"""
+    global _worker_generator, _worker_init_error
+    # A worker whose initializer fails is respawned by the pool forever, so the
+    # failure is kept and raised from the first task, which aborts the run
+    try:
+        _worker_generator = HRDataGenerator(config_file)
+        _worker_generator.connect_to_mongodb()
+    except (Exception, SystemExit) as e:
+        _worker_init_error = f"Worker could not connect to MongoDB: {e}"
+
+def process_company(args):
+    """Generate employees for one company inside a worker process"""
+    company, opts = args
+    if _worker_init_error:
+        raise RuntimeError(_worker_init_error)
+    
+    # Seed per company so runs are reproducible regardless of worker scheduling
+    if opts['seed'] is not None:
+        company_seed = opts['seed'] + zlib.crc32(company['company_id'].encode())
+        random.seed(company_seed)
+        Faker.seed(company_seed)
+    
+    try:
+        active = _worker_generator.generate_company_employees(company, opts['employees_per_company'])
+        return company['name'], active, None
+    except Exception as e:
+        return company['name'], [], str(e)
+
 @click.command()
 @click.option('--companies', default=100, help='Number of companies to generate')
 @click.option('--employees-per-company', default=1000, help='Number of employees per company')
 @click.option('--months', default=12, help='Number of months of historical data')
 @click.option('--config', default='../config/accounts.json', help='Configuration file path')
 @click.option('--skip-files', is_flag=True, help='Skip generating dummy files')
-def main(companies, employees_per_company, months, config, skip_files):
+@click.option('--workers', default=os.cpu_count(), help='Number of worker processes for employee generation')
+@click.option('--seed', default=None, type=int, help='Base random seed for reproducible runs')
+def main(companies, employees_per_company, months, config, skip_files, workers, seed):
     """Generate HR management dummy data for MongoDB cluster"""
     
     print(f"{Fore.GREEN}=== HR DATA GENERATOR ==={Style.RESET_ALL}")
@@ -664,9 +786,14 @@ def main(companies, employees_per_company, months, config, skip_files):
     print(f"Employees per company: {employees_per_company}")
     print(f"Historical data: {months} months")
     print(f"Skip files: {skip_files}")
+    print(f"Workers: {workers}")
     print()
     
     try:
+        if seed is not None:
+            random.seed(seed)
+            Faker.seed(seed)
+        
         # Initialize generator
         generator = HRDataGenerator(config)
         
@@ -678,7 +805,7 @@ def main(companies, employees_per_company, months, config, skip_files):
         
         # Generate data
         generator.generate_companies(companies)
-        generator.generate_employees(employees_per_company)
+        generator.generate_employees(employees_per_company, workers, seed)
         generator.generate_attendance_data(months)
         generator.generate_leave_data()
         generator.generate_payroll_data(months)
@@ -686,6 +813,8 @@ def main(companies, employees_per_company, months, config, skip_files):
         if not skip_files:
             generator.generate_documents()
         
+        generator.flush_to_disk()
+        
         # Generate summary
         stats = generator.generate_summary_statistics()
         
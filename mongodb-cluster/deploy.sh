@@ -298,9 +298,10 @@ Restart=always
 RestartSec=10
 Environment=NODE_ENV=production
 Environment=PORT=3000
+Environment=MONITORING_INTERVAL_MS=5000
 Environment=DASHBOARD_USERNAME=admin
 Environment=DASHBOARD_PASSWORD=admin123
-Environment=JWT_SECRET=mongodb-cluster-jwt-secret-$(date +%s)
+Environment=JWT_SECRET=$(openssl rand -hex 32)
 
 # Security settings
 NoNewPrivileges=true
@@ -467,7 +468,7 @@ create_backup() {
 run_load_test() {
     echo "Running MongoDB load tests..."
     cd "$SCRIPT_DIR/load-testing"
-    python3 load_test_runner.py --threads 10 --operations 100
+    python3 load_test_runner.py --async-workers 100 --async-operations 50
 }
 
 generate_data() {
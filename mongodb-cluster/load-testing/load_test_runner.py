@@ -43,6 +43,27 @@ class MongoLoadTester:
         self.start_time = None
         self.end_time = None
         
+        # Prefetched employee IDs so reads don't pay a $sample round-trip each
+        self.employee_ids = []
+        self.employee_ids_loaded_at = 0
+        self.employee_id_refresh_seconds = 600
+        self.employee_id_prefetch_size = 10000
+        self.employee_ids_thread_lock = threading.Lock()
+        self.employee_ids_refresh_lock = None  # asyncio.Lock, created inside the async test's event loop
+        self.write_batch_size = 100  # Documents per insert_many write
+        
+        # Connection pool settings shared by every PyMongo and Motor client;
+        # a warm minimum keeps bursts from paying connect + auth on first use
+        self.pool_options = {
+            'maxPoolSize': 200,
+            'minPoolSize': 10,
+            'maxIdleTimeMS': 300000,
+            'waitQueueTimeoutMS': 2000,
+            'serverSelectionTimeoutMS': 5000,
+            'retryReads': True,
+            'appname': 'load-test-runner'
+        }
+        
         # Test configuration
         self.test_collections = ['employees', 'attendance', 'payroll', 'leaves', 'documents']
         self.operation_weights = {
@@ -79,41 +100,78 @@ class MongoLoadTester:
             rs_connection_string += ",".join(hosts)
             rs_connection_string += f"/{self.config['hr_database']['name']}?replicaSet={self.config['mongodb_cluster']['replica_set_name']}"
             
-            self.clients['replica_set'] = pymongo.MongoClient(rs_connection_string)
-            self.async_clients['replica_set'] = motor.motor_asyncio.AsyncIOMotorClient(rs_connection_string)
+            self.clients['replica_set'] = pymongo.MongoClient(rs_connection_string, **self.pool_options)
+            self.async_clients['replica_set'] = motor.motor_asyncio.AsyncIOMotorClient(
+                rs_connection_string, **self.pool_options)
             
             # Individual node connections (for read testing)
             for node in self.config['mongodb_cluster']['nodes']:
                 node_id = f"node_{node['id']}"
                 connection_string = f"mongodb://{node['user']}:{node['password']}@{node['ip']}:{node['port']}/{self.config['hr_database']['name']}"
                 
-                self.clients[node_id] = pymongo.MongoClient(connection_string)
-                self.async_clients[node_id] = motor.motor_asyncio.AsyncIOMotorClient(connection_string)
+                self.clients[node_id] = pymongo.MongoClient(connection_string, **self.pool_options)
+                self.async_clients[node_id] = motor.motor_asyncio.AsyncIOMotorClient(
+                    connection_string, **self.pool_options)
                 
                 print(f"{Fore.GREEN}✓{Style.RESET_ALL} Connected to {node['hostname']} ({node['role']})")
             
-            # Test connections
-            for client_name, client in self.clients.items():
-                client.admin.command('ping')
-                print(f"{Fore.GREEN}✓{Style.RESET_ALL} {client_name} connection verified")
+            # Test connections, pinging every node at once so setup waits on the
+            # slowest node rather than the sum of their round-trips
+            with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+                pings = {
+                    executor.submit(client.admin.command, 'ping'): client_name
+                    for client_name, client in self.clients.items()
+                }
+                for future in as_completed(pings):
+                    future.result()
+                    print(f"{Fore.GREEN}✓{Style.RESET_ALL} {pings[future]} connection verified")
+            
+            self.load_employee_ids()
+            print(f"{Fore.GREEN}✓{Style.RESET_ALL} Prefetched {len(self.employee_ids):,} employee IDs")
                 
         except Exception as e:
             print(f"{Fore.RED}Failed to setup connections: {e}{Style.RESET_ALL}")
             sys.exit(1)
 
-    def get_random_employee_id(self, client):
-        """Get random employee ID for testing"""
-        try:
-            db = client[self.config['hr_database']['name']]
-            sample = list(db.employees.aggregate([{'$sample': {'size': 1}}]))
-            return sample[0]['employee_id'] if sample else None
-        except:
-            return None
+    def load_employee_ids(self):
+        """Prefetch a pool of employee IDs to draw from during the test"""
+        db = self.clients['replica_set'][self.config['hr_database']['name']]
+        # Projected IDs are tiny, so fetch the whole pool in the first reply
+        # rather than a 101-document batch followed by a getMore
+        cursor = (db.employees.find({}, {'employee_id': 1, '_id': 0})
+                  .limit(self.employee_id_prefetch_size)
+                  .batch_size(self.employee_id_prefetch_size))
+        self.employee_ids = [doc['employee_id'] for doc in cursor]
+        self.employee_ids_loaded_at = time.time()
+
+    def employee_ids_stale(self):
+        """Check whether the prefetched employee IDs should be refreshed"""
+        return time.time() - self.employee_ids_loaded_at > self.employee_id_refresh_seconds
+
+    def employee_ids_refresh_failed(self, error):
+        """Keep the previous pool after a failed refresh and wait a full interval before retrying"""
+        self.employee_ids_loaded_at = time.time()
+        print(f"{Fore.YELLOW}Failed to refresh employee IDs, keeping the previous pool: {error}{Style.RESET_ALL}")
+
+    def refresh_employee_ids(self):
+        """Reload the prefetched employee IDs once they are stale"""
+        if not self.employee_ids_stale():
+            return
+        
+        # The first thread to see a stale pool reloads it; the rest wait on the
+        # lock and find it fresh instead of all fetching the same IDs at once
+        with self.employee_ids_thread_lock:
+            try:
+                if self.employee_ids_stale():
+                    self.load_employee_ids()
+            except Exception as e:
+                self.employee_ids_refresh_failed(e)
 
     def generate_test_data(self):
         """Generate test data for write operations"""
         return {
             'test_record_id': f"TEST_{random.randint(100000, 999999)}",
+            'employee_id': random.choice(self.employee_ids) if self.employee_ids else None,
             'timestamp': datetime.now(),
             'data': {
                 'field1': random.randint(1, 1000),
@@ -129,144 +187,126 @@ class MongoLoadTester:
             }
         }
 
+    def build_read_operation(self, collection_name):
+        """Pick a random read for a collection as (operation_type, argument), shared by the sync and async runners"""
+        operation_type = random.choice(['find_one', 'find_many', 'aggregate', 'count'])
+        
+        if operation_type == 'find_one':
+            if collection_name == 'employees':
+                # None when no employee IDs are loaded; the read is then skipped
+                employee_id = random.choice(self.employee_ids) if self.employee_ids else None
+                return operation_type, {'employee_id': employee_id} if employee_id else None
+            return operation_type, {}
+        
+        if operation_type == 'find_many':
+            return operation_type, random.randint(10, 100)
+        
+        if operation_type == 'aggregate':
+            if collection_name == 'employees':
+                pipeline = [
+                    {'$match': {'employment_status': 'Active'}},
+                    {'$group': {'_id': '$department', 'count': {'$sum': 1}}},
+                    {'$limit': 10}
+                ]
+            elif collection_name == 'attendance':
+                pipeline = [
+                    {'$match': {'date': {'$gte': datetime.now() - timedelta(days=30)}}},
+                    {'$group': {'_id': '$employee_id', 'total_hours': {'$sum': '$work_hours'}}},
+                    {'$limit': 50}
+                ]
+            else:
+                pipeline = [{'$sample': {'size': 10}}]
+            return operation_type, pipeline
+        
+        # count
+        return operation_type, {'employment_status': 'Active'} if collection_name == 'employees' else {}
+
+    def build_write_operation(self):
+        """Pick a random write as (operation_type, argument), shared by the sync and async runners"""
+        operation_type = random.choice(['insert_one', 'insert_many', 'update_one', 'delete_one'])
+        
+        if operation_type == 'insert_one':
+            return operation_type, self.generate_test_data()
+        if operation_type == 'insert_many':
+            return operation_type, [self.generate_test_data() for _ in range(self.write_batch_size)]
+        if operation_type == 'update_one':
+            # Update a random test record
+            return operation_type, ({'metadata.test_type': 'load_test'}, {'$set': {'data.updated_at': datetime.now()}})
+        # delete_one: delete a random test record
+        return operation_type, {'metadata.test_type': 'load_test'}
+
+    def operation_result(self, operation, client_name, collection_name, start_time, records_affected, error):
+        """Build the result record for one operation"""
+        return {
+            'operation': operation,
+            'client': client_name,
+            'collection': collection_name,
+            'success': error is None,
+            'duration': time.time() - start_time,
+            'records_affected': records_affected,
+            'error': error,
+            'timestamp': datetime.now()
+        }
+
     def perform_read_operation(self, client_name, collection_name):
         """Perform a read operation"""
         start_time = time.time()
-        success = False
         error = None
         records_read = 0
         
         try:
             client = self.clients[client_name]
-            db = client[self.config['hr_database']['name']]
-            collection = db[collection_name]
+            collection = client[self.config['hr_database']['name']][collection_name]
             
-            # Random read operation
-            operation_type = random.choice(['find_one', 'find_many', 'aggregate', 'count'])
+            if collection_name == 'employees':
+                self.refresh_employee_ids()
+            operation_type, argument = self.build_read_operation(collection_name)
             
             if operation_type == 'find_one':
-                if collection_name == 'employees':
-                    employee_id = self.get_random_employee_id(client)
-                    if employee_id:
-                        result = collection.find_one({'employee_id': employee_id})
-                        records_read = 1 if result else 0
-                else:
-                    result = collection.find_one()
-                    records_read = 1 if result else 0
-                    
+                if argument is not None:
+                    records_read = 1 if collection.find_one(argument) else 0
             elif operation_type == 'find_many':
-                limit = random.randint(10, 100)
-                if collection_name == 'employees':
-                    results = list(collection.find().limit(limit))
-                else:
-                    results = list(collection.find().limit(limit))
-                records_read = len(results)
-                
+                records_read = len(list(collection.find().limit(argument)))
             elif operation_type == 'aggregate':
-                if collection_name == 'employees':
-                    pipeline = [
-                        {'$match': {'employment_status': 'Active'}},
-                        {'$group': {'_id': '$department', 'count': {'$sum': 1}}},
-                        {'$limit': 10}
-                    ]
-                elif collection_name == 'attendance':
-                    pipeline = [
-                        {'$match': {'date': {'$gte': datetime.now() - timedelta(days=30)}}},
-                        {'$group': {'_id': '$employee_id', 'total_hours': {'$sum': '$work_hours'}}},
-                        {'$limit': 50}
-                    ]
-                else:
-                    pipeline = [{'$sample': {'size': 10}}]
-                
-                results = list(collection.aggregate(pipeline))
-                records_read = len(results)
-                
+                records_read = len(list(collection.aggregate(argument)))
             else:  # count
-                if collection_name == 'employees':
-                    records_read = collection.count_documents({'employment_status': 'Active'})
-                else:
-                    records_read = collection.count_documents({})
-            
-            success = True
+                records_read = collection.count_documents(argument)
             
         except Exception as e:
             error = str(e)
         
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        return {
-            'operation': 'read',
-            'client': client_name,
-            'collection': collection_name,
-            'success': success,
-            'duration': duration,
-            'records_affected': records_read,
-            'error': error,
-            'timestamp': datetime.now(),
-            'thread_id': threading.current_thread().ident
-        }
+        result = self.operation_result('read', client_name, collection_name, start_time, records_read, error)
+        result['thread_id'] = threading.current_thread().ident
+        return result
 
     def perform_write_operation(self, collection_name):
         """Perform a write operation (always to replica set)"""
         start_time = time.time()
-        success = False
         error = None
         records_written = 0
         
         try:
             client = self.clients['replica_set']
-            db = client[self.config['hr_database']['name']]
-            
             # Use test collection to avoid interfering with real data
-            collection = db[f"{collection_name}_test"]
+            collection = client[self.config['hr_database']['name']][f"{collection_name}_test"]
             
-            # Random write operation
-            operation_type = random.choice(['insert_one', 'insert_many', 'update_one', 'delete_one'])
+            operation_type, argument = self.build_write_operation()
             
             if operation_type == 'insert_one':
-                test_data = self.generate_test_data()
-                result = collection.insert_one(test_data)
-                records_written = 1 if result.inserted_id else 0
-                
+                records_written = 1 if collection.insert_one(argument).inserted_id else 0
             elif operation_type == 'insert_many':
-                count = random.randint(2, 10)
-                test_data = [self.generate_test_data() for _ in range(count)]
-                result = collection.insert_many(test_data)
-                records_written = len(result.inserted_ids)
-                
+                records_written = len(collection.insert_many(argument, ordered=False).inserted_ids)
             elif operation_type == 'update_one':
-                # Update a random test record
-                filter_query = {'metadata.test_type': 'load_test'}
-                update_data = {'$set': {'data.updated_at': datetime.now()}}
-                result = collection.update_one(filter_query, update_data)
-                records_written = result.modified_count
-                
+                records_written = collection.update_one(*argument).modified_count
             else:  # delete_one
-                # Delete a random test record
-                filter_query = {'metadata.test_type': 'load_test'}
-                result = collection.delete_one(filter_query)
-                records_written = result.deleted_count
-            
-            success = True
+                records_written = collection.delete_one(argument).deleted_count
             
         except Exception as e:
             error = str(e)
         
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        return {
-            'operation': 'write',
-            'client': 'replica_set',
-            'collection': collection_name,
-            'success': success,
-            'duration': duration,
-            'records_affected': records_written,
-            'error': error,
-            'timestamp': datetime.now(),
-            'thread_id': threading.current_thread().ident
-        }
+        result = self.operation_result('write', 'replica_set', collection_name, start_time, records_written, error)
+        result['thread_id'] = threading.current_thread().ident
+        return result
 
     def perform_analytics_operation(self):
         """Perform analytics/reporting operations"""
@@ -317,13 +357,14 @@ class MongoLoadTester:
                         'avg_hours': {'$avg': '$work_hours'},
                         'total_overtime': {'$sum': '$overtime_hours'}
                     }},
+                    # Limit before joining so only the returned rows pay for the $lookup
+                    {'$limit': 100},
                     {'$lookup': {
                         'from': 'employees',
                         'localField': '_id',
                         'foreignField': 'employee_id',
                         'as': 'employee_info'
-                    }},
-                    {'$limit': 100}
+                    }}
                 ]
                 results = list(db.attendance.aggregate(pipeline))
                 
@@ -355,20 +396,21 @@ class MongoLoadTester:
                 results = list(db.leaves.aggregate(pipeline))
                 
             else:  # department_metrics
+                # Filter the indexed attendance date range first so $lookup only joins the 30-day slice
                 pipeline = [
+                    {'$match': {'date': {'$gte': datetime.now() - timedelta(days=30)}}},
                     {'$lookup': {
-                        'from': 'attendance',
+                        'from': 'employees',
                         'localField': 'employee_id',
                         'foreignField': 'employee_id',
-                        'as': 'attendance_data'
+                        'as': 'employee'
                     }},
-                    {'$unwind': {'path': '$attendance_data', 'preserveNullAndEmptyArrays': True}},
-                    {'$match': {'attendance_data.date': {'$gte': datetime.now() - timedelta(days=30)}}},
+                    {'$unwind': '$employee'},
                     {'$group': {
-                        '_id': '$department',
+                        '_id': '$employee.department',
                         'employee_count': {'$addToSet': '$employee_id'},
-                        'total_work_hours': {'$sum': '$attendance_data.work_hours'},
-                        'avg_salary': {'$avg': '$salary'}
+                        'total_work_hours': {'$sum': '$work_hours'},
+                        'avg_salary': {'$avg': '$employee.salary'}
                     }},
                     {'$project': {
                         'employee_count': {'$size': '$employee_count'},
@@ -377,7 +419,7 @@ class MongoLoadTester:
                     }},
                     {'$sort': {'employee_count': -1}}
                 ]
-                results = list(db.employees.aggregate(pipeline))
+                results = list(db.attendance.aggregate(pipeline, allowDiskUse=True))
             
             records_processed = len(results)
             success = True
@@ -436,50 +478,101 @@ class MongoLoadTester:
         
         return thread_results
 
+    async def async_refresh_employee_ids(self):
+        """Reload the prefetched employee IDs once they are stale (async)"""
+        if not self.employee_ids_stale():
+            return
+        
+        # The first coroutine to see a stale pool reloads it; the rest wait on the
+        # lock and find it fresh instead of all fetching the same IDs at once
+        async with self.employee_ids_refresh_lock:
+            try:
+                if self.employee_ids_stale():
+                    db = self.async_clients['replica_set'][self.config['hr_database']['name']]
+                    cursor = (db.employees.find({}, {'employee_id': 1, '_id': 0})
+                              .limit(self.employee_id_prefetch_size)
+                              .batch_size(self.employee_id_prefetch_size))
+                    self.employee_ids = [doc['employee_id'] async for doc in cursor]
+                    self.employee_ids_loaded_at = time.time()
+            except Exception as e:
+                self.employee_ids_refresh_failed(e)
+
+    async def async_read_operation(self, client_name, collection_name):
+        """Perform a read operation on a Motor client"""
+        start_time = time.time()
+        error = None
+        records_read = 0
+        
+        try:
+            client = self.async_clients[client_name]
+            collection = client[self.config['hr_database']['name']][collection_name]
+            
+            if collection_name == 'employees':
+                await self.async_refresh_employee_ids()
+            operation_type, argument = self.build_read_operation(collection_name)
+            
+            if operation_type == 'find_one':
+                if argument is not None:
+                    records_read = 1 if await collection.find_one(argument) else 0
+            elif operation_type == 'find_many':
+                records_read = len(await collection.find().limit(argument).to_list(length=argument))
+            elif operation_type == 'aggregate':
+                records_read = len(await collection.aggregate(argument).to_list(length=None))
+            else:  # count
+                records_read = await collection.count_documents(argument)
+            
+        except Exception as e:
+            error = str(e)
+        
+        return self.operation_result('async_read', client_name, collection_name, start_time, records_read, error)
+
+    async def async_write_operation(self, collection_name):
+        """Perform a write operation on the replica set Motor client"""
+        start_time = time.time()
+        error = None
+        records_written = 0
+        
+        try:
+            client = self.async_clients['replica_set']
+            # Use test collection to avoid interfering with real data
+            collection = client[self.config['hr_database']['name']][f"{collection_name}_test"]
+            
+            operation_type, argument = self.build_write_operation()
+            
+            if operation_type == 'insert_one':
+                records_written = 1 if (await collection.insert_one(argument)).inserted_id else 0
+            elif operation_type == 'insert_many':
+                records_written = len((await collection.insert_many(argument, ordered=False)).inserted_ids)
+            elif operation_type == 'update_one':
+                records_written = (await collection.update_one(*argument)).modified_count
+            else:  # delete_one
+                records_written = (await collection.delete_one(argument)).deleted_count
+            
+        except Exception as e:
+            error = str(e)
+        
+        return self.operation_result('async_write', 'replica_set', collection_name, start_time, records_written, error)
+
     async def async_worker(self, worker_id, operations_per_worker, progress_bar=None):
-        """Async worker for concurrent operations"""
+        """Async worker running the weighted operation mix on Motor clients"""
         worker_results = []
         
         for _ in range(operations_per_worker):
-            start_time = time.time()
-            success = False
-            error = None
+            # Choose operation type based on weights
+            operation_type = random.choices(
+                list(self.operation_weights.keys()),
+                weights=list(self.operation_weights.values())
+            )[0]
             
-            try:
-                # Choose random async client
+            collection_name = random.choice(self.test_collections)
+            if operation_type == 'read':
                 client_name = random.choice(list(self.async_clients.keys()))
-                client = self.async_clients[client_name]
-                db = client[self.config['hr_database']['name']]
-                
-                # Perform async read operation
-                collection_name = random.choice(self.test_collections)
-                collection = db[collection_name]
-                
-                # Simple async read
-                result = await collection.find_one()
-                success = True
-                records_affected = 1 if result else 0
-                
-            except Exception as e:
-                error = str(e)
-                records_affected = 0
-            
-            end_time = time.time()
-            duration = end_time - start_time
-            
-            result_data = {
-                'operation': 'async_read',
-                'client': client_name,
-                'collection': collection_name,
-                'success': success,
-                'duration': duration,
-                'records_affected': records_affected,
-                'error': error,
-                'timestamp': datetime.now(),
-                'worker_id': worker_id
-            }
+                result = await self.async_read_operation(client_name, collection_name)
+            else:  # write, update, delete
+                result = await self.async_write_operation(collection_name)
             
-            worker_results.append(result_data)
+            result['worker_id'] = worker_id
+            worker_results.append(result)
             
             if progress_bar:
                 progress_bar.update(1)
@@ -519,6 +612,10 @@ class MongoLoadTester:
         print(f"{Fore.CYAN}Running async test with {num_workers} workers, {operations_per_worker} operations each{Style.RESET_ALL}")
         
         total_operations = num_workers * operations_per_worker
+        self.employee_ids_refresh_lock = asyncio.Lock()
+        
+        if not self.start_time:
+            self.start_time = datetime.now()
         
         with tqdm(total=total_operations, desc="Async Testing", colour='blue') as pbar:
             tasks = []
@@ -536,6 +633,8 @@ class MongoLoadTester:
                     print(f"{Fore.RED}Async worker failed: {result}{Style.RESET_ALL}")
                 else:
                     self.test_results.extend(result)
+        
+        self.end_time = datetime.now()
 
     def generate_performance_report(self):
         """Generate comprehensive performance report"""
@@ -730,7 +829,17 @@ class MongoLoadTester:
         """Monitor system resources during testing"""
         print(f"{Fore.CYAN}Monitoring system resources for {duration} seconds...{Style.RESET_ALL}")
         
-        resource_data = []
+        # One list per metric rather than a dict per sample, so the frame is
+        # built from ready-made columns instead of regrouping every sample
+        resource_data = {
+            'timestamp': [],
+            'cpu_percent': [],
+            'memory_percent': [],
+            'memory_used_gb': [],
+            'disk_percent': [],
+            'network_bytes_sent': [],
+            'network_bytes_recv': []
+        }
         start_time = time.time()
         
         while time.time() - start_time < duration:
@@ -739,15 +848,13 @@ class MongoLoadTester:
             disk = psutil.disk_usage('/')
             network = psutil.net_io_counters()
             
-            resource_data.append({
-                'timestamp': datetime.now(),
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_used_gb': memory.used / (1024**3),
-                'disk_percent': disk.percent,
-                'network_bytes_sent': network.bytes_sent,
-                'network_bytes_recv': network.bytes_recv
-            })
+            resource_data['timestamp'].append(datetime.now())
+            resource_data['cpu_percent'].append(cpu_percent)
+            resource_data['memory_percent'].append(memory.percent)
+            resource_data['memory_used_gb'].append(memory.used / (1024**3))
+            resource_data['disk_percent'].append(disk.percent)
+            resource_data['network_bytes_sent'].append(network.bytes_sent)
+            resource_data['network_bytes_recv'].append(network.bytes_recv)
             
             time.sleep(1)
         
@@ -764,13 +871,14 @@ class MongoLoadTester:
 @click.command()
 @click.option('--threads', default=10, help='Number of concurrent threads')
 @click.option('--operations', default=100, help='Operations per thread')
-@click.option('--async-workers', default=20, help='Number of async workers')
+@click.option('--async-workers', default=20, help='Number of async workers (coroutines sharing one Motor pool per node)')
 @click.option('--async-operations', default=50, help='Operations per async worker')
 @click.option('--config', default='../config/accounts.json', help='Configuration file')
 @click.option('--cleanup/--no-cleanup', default=True, help='Cleanup test data after testing')
 @click.option('--monitor-resources', is_flag=True, help='Monitor system resources during test')
 @click.option('--test-type', type=click.Choice(['concurrent', 'async', 'both']), default='both', help='Type of test to run')
-def main(threads, operations, async_workers, async_operations, config, cleanup, monitor_resources, test_type):
+@click.option('--write-batch-size', default=100, help='Documents per insert_many write operation')
+def main(threads, operations, async_workers, async_operations, config, cleanup, monitor_resources, test_type, write_batch_size):
     """MongoDB Cluster Load Testing Tool"""
     
     print(f"{Fore.GREEN}=== MongoDB Cluster Load Testing Tool ==={Style.RESET_ALL}")
@@ -780,11 +888,13 @@ def main(threads, operations, async_workers, async_operations, config, cleanup,
     print(f"Operations per Thread: {operations}")
     print(f"Async Workers: {async_workers}")
     print(f"Operations per Worker: {async_operations}")
+    print(f"Write Batch Size: {write_batch_size}")
     print()
     
     try:
         # Initialize load tester
         tester = MongoLoadTester(config)
+        tester.write_batch_size = write_batch_size
         
         # Setup connections
         tester.setup_connections()
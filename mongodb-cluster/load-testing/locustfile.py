@@ -18,6 +18,13 @@ from locust.runners import MasterRunner, WorkerRunner
 # Add parent directory to path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Parsed config keyed by path, reused until the file's mtime changes
+_config_cache = {}
+
+# One pooled MongoClient per connection string, shared by every simulated user
+# in this process instead of a client (and monitor threads) per user
+_shared_clients = {}
+
 class MongoDBUser:
     def __init__(self, config_file='../config/accounts.json'):
         self.config_file = config_file
@@ -27,10 +34,17 @@ class MongoDBUser:
         self.setup_connection()
 
     def load_config(self):
-        """Load configuration from accounts.json"""
+        """Load configuration from accounts.json, reusing the parsed copy while unchanged"""
         try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+            cached = _config_cache.get(self.config_file)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
             with open(self.config_file, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
+            _config_cache[self.config_file] = (mtime, config)
+            return config
         except Exception as e:
             print(f"Failed to load config: {e}")
             sys.exit(1)
@@ -51,11 +65,15 @@ class MongoDBUser:
             connection_string += ",".join(hosts)
             connection_string += f"/{self.config['hr_database']['name']}?replicaSet={self.config['mongodb_cluster']['replica_set_name']}"
             
-            self.client = pymongo.MongoClient(connection_string)
-            self.db = self.client[self.config['hr_database']['name']]
+            self.client = _shared_clients.get(connection_string)
+            if self.client is None:
+                self.client = pymongo.MongoClient(connection_string, maxPoolSize=200, appname='locust')
+                
+                # Test connection
+                self.client.admin.command('ping')
+                _shared_clients[connection_string] = self.client
             
-            # Test connection
-            self.client.admin.command('ping')
+            self.db = self.client[self.config['hr_database']['name']]
             
         except Exception as e:
             print(f"Failed to connect to MongoDB: {e}")
@@ -71,8 +89,8 @@ class MongoLoadTestUser(HttpUser):
 
     def on_stop(self):
         """Clean up when user stops"""
-        if self.mongo and self.mongo.client:
-            self.mongo.client.close()
+        # The MongoClient is shared across users and closed when the test stops
+        self.mongo = None
 
     @task(60)  # 60% of operations are reads
     def read_employees(self):
@@ -317,6 +335,10 @@ def on_test_stop(environment, **kwargs):
             print(f"Cleaned up {result.deleted_count} test documents")
         except Exception as e:
             print(f"Failed to clean up test data: {e}")
+    
+    for client in _shared_clients.values():
+        client.close()
+    _shared_clients.clear()
 
 @events.request.add_listener
 def on_request(request_type, name, response_time, response_length, exception, context, **kwargs):